@@ -16,6 +16,7 @@ def run_cmd(cmd: str) -> None:
     commands = {
         "test": f"{python_cmd} -m pytest",
         "test-fast": f"{python_cmd} -m pytest -x --tb=short",
+        "test-parallel": f"{python_cmd} -m pytest -n auto --dist loadfile",
         "cov": f"{python_cmd} -m pytest --cov=src --cov-report=html",
         "lint": "ruff check . --fix && ruff format .",
         "type": f"{python_cmd} -m mypy src/ tests/",
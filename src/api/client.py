@@ -342,6 +342,22 @@ class BinanceClient:
         self._cache_expirations[cache_key] = time.time() + ttl_seconds
         return exchange_info
 
+    def clear_exchange_info_cache(self, symbol: str | None = None) -> None:
+        """Drop cached exchange info so the next `get_exchange_info` call refetches it.
+
+        Args:
+            symbol: The trading symbol whose cached entry to drop (e.g., "BTCUSDT").
+                If None, every cached exchange info response is dropped.
+        """
+        if symbol is None:
+            self._cache.clear()
+            self._cache_expirations.clear()
+            return
+
+        cache_key = f"exchange_info_{symbol.upper()}"
+        self._cache.pop(cache_key, None)
+        self._cache_expirations.pop(cache_key, None)
+
     def get_klines(self, symbol: str, interval: str = "1d", limit: int = 500) -> list[RawKline]:
         """Get Kline/candlestick data for a symbol.
 
@@ -1,25 +1,263 @@
 """Order validation utility for pre-checking Binance API constraints."""
 
 import logging
+import math
+import time
+from collections import defaultdict
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from decimal import ROUND_FLOOR, Decimal
+from enum import StrEnum
 from typing import Any, cast
 
 from api.client import BinanceClient
 from api.enums import OrderSide, OrderType
-from core.precision_formatter import PrecisionFormatter
 
 logger = logging.getLogger(__name__)
 
+# How long a full ticker snapshot may be reused for price lookups
+TICKER_CACHE_TTL_SECONDS = 0.5
+# How long exchange info (and the filters parsed from it) may be reused for a symbol
+EXCHANGE_INFO_TTL_SECONDS = 60.0
+# How long a formatted lot-size display string may be reused for a symbol
+DISPLAY_CACHE_TTL_SECONDS = 300.0
+
+
+class ValidationErrorCode(StrEnum):
+    """Stable identifiers for validation failures, independent of message wording."""
+
+    IMMEDIATE_SELL_LIMIT = "IMMEDIATE_SELL_LIMIT"
+    IMMEDIATE_BUY_LIMIT = "IMMEDIATE_BUY_LIMIT"
+    IMMEDIATE_OCO_LIMIT = "IMMEDIATE_OCO_LIMIT"
+    IMMEDIATE_OCO_STOP = "IMMEDIATE_OCO_STOP"
+    LOT_MIN = "LOT_MIN"
+    LOT_MAX = "LOT_MAX"
+    LOT_STEP = "LOT_STEP"
+    PRICE_MIN = "PRICE_MIN"
+    PRICE_MAX = "PRICE_MAX"
+    PRICE_TICK = "PRICE_TICK"
+    PERCENT_UP = "PERCENT_UP"
+    PERCENT_DOWN = "PERCENT_DOWN"
+    NOTIONAL_MIN = "NOTIONAL_MIN"
+    NOTIONAL_MAX = "NOTIONAL_MAX"
+
+
+# Validation error messages keyed by error code
+_TEMPLATES: dict[ValidationErrorCode, str] = {
+    ValidationErrorCode.IMMEDIATE_SELL_LIMIT: "🚨 CRITICAL: SELL LIMIT at ${price:,.2f} would fill IMMEDIATELY (current price: ${current:,.2f}). For profit-taking, use price > ${current:,.2f}",
+    ValidationErrorCode.IMMEDIATE_BUY_LIMIT: "🚨 CRITICAL: BUY LIMIT at ${price:,.2f} would fill IMMEDIATELY (current price: ${current:,.2f}). For accumulation, use price < ${current:,.2f}",
+    ValidationErrorCode.IMMEDIATE_OCO_LIMIT: "🚨 CRITICAL: OCO limit price ${price:,.2f} would fill IMMEDIATELY (current price: ${current:,.2f}). Take-profit must be > ${current:,.2f}",
+    ValidationErrorCode.IMMEDIATE_OCO_STOP: "🚨 CRITICAL: OCO stop price ${price:,.2f} would trigger IMMEDIATELY (current price: ${current:,.2f}). Stop-loss must be < ${current:,.2f}",
+    ValidationErrorCode.LOT_MIN: "❌ QUANTITY TOO SMALL: {quantity} below minimum {min_qty} (exchange requirement)",
+    ValidationErrorCode.LOT_MAX: "❌ QUANTITY TOO LARGE: {quantity} above maximum {max_qty} (exchange requirement)",
+    ValidationErrorCode.LOT_STEP: "❌ PRECISION ERROR: Quantity {quantity} not aligned with step size {step} ({decimals} decimal places). SUGGESTED: {suggested:.{decimals}f}",
+    ValidationErrorCode.PRICE_MIN: "Price ${price:,.8f} below minimum ${min_price:,.8f}",
+    ValidationErrorCode.PRICE_MAX: "Price ${price:,.8f} above maximum ${max_price:,.8f}",
+    ValidationErrorCode.PRICE_TICK: "Price ${price:,.8f} not aligned with tick size ${tick:,.8f}",
+    ValidationErrorCode.PERCENT_UP: "Price ${price:,.2f} above {side} limit ${limit:,.2f} ({multiplier}x current)",
+    ValidationErrorCode.PERCENT_DOWN: "Price ${price:,.2f} below {side} limit ${limit:,.2f} ({multiplier}x current)",
+    ValidationErrorCode.NOTIONAL_MIN: "Notional ${notional:,.2f} below minimum ${min_notional:,.2f}",
+    ValidationErrorCode.NOTIONAL_MAX: "Notional ${notional:,.2f} above maximum ${max_notional:,.2f}",
+}
+
+
+class CodedValidationError(str):
+    """Validation error message tagged with a stable error code.
+
+    Instances are the formatted message itself, so callers can keep printing, joining and
+    substring-matching errors, while code that only needs the failure reason can compare `code`.
+    """
+
+    code: ValidationErrorCode
+
+    def __new__(cls, code: ValidationErrorCode, **fields: Any) -> "CodedValidationError":
+        """Format the message for `code` from `_TEMPLATES` with the given fields."""
+        return cls.from_message(_TEMPLATES[code].format(**fields), code)
+
+    @classmethod
+    def from_message(cls, message: str, code: ValidationErrorCode) -> "CodedValidationError":
+        """Tag an already formatted message with `code`."""
+        error = str.__new__(cls, message)
+        error.code = code
+        return error
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Rebuild from the formatted message, since the template fields are not kept (for copy and pickle)."""
+        return self.from_message, (str(self), self.code)
+
+
+def _mantissa(raw: Any) -> tuple[int, int]:
+    """Split a raw filter value into an integer mantissa and decimal scale.
+
+    The exchange sends values such as "0.00010000", which parse to (1, 4). Parsing the string
+    directly keeps the grid exact without a float round trip. The scale is never negative.
+    """
+    sign, digits, exponent = Decimal(str(raw)).normalize().as_tuple()
+    if not isinstance(exponent, int):
+        return 0, 0
+    mantissa = int("".join(map(str, digits)))
+    if sign:
+        mantissa = -mantissa
+    if exponent > 0:
+        return mantissa * 10**exponent, 0
+    return mantissa, -exponent
+
+
+def _rescale(mantissa: int, scale: int, exponent: int) -> int:
+    """Express a (mantissa, scale) value as integer units of `10**-exponent` (requires exponent >= scale)."""
+    # int ** int is typed as Any because a negative exponent gives a float
+    return int(mantissa * 10 ** (exponent - scale))
+
+
+def _scaled_units(value: float | Decimal, exponent: int) -> tuple[int, bool]:
+    """Scale `value` by `10**exponent` into integer units.
+
+    Accepts floats and the Decimals returned by the precision formatter's `*_decimal` methods.
+
+    Returns:
+        Tuple of (floored_units, exact) where `exact` is False if `value` has finer precision
+        than `exponent` decimal places.
+    """
+    scaled = Decimal(str(value)).scaleb(exponent)
+    units = scaled.to_integral_value(rounding=ROUND_FLOOR)
+    return int(units), units == scaled
+
+
+@dataclass(slots=True, frozen=True)
+class SymbolSpec:
+    """Numeric exchange filters for one symbol, parsed once from the raw filter strings.
+
+    Missing filters are represented by neutral bounds, so every check can run unconditionally
+    without rejecting anything.
+    """
+
+    min_qty: float = 0.0
+    max_qty: float = math.inf
+    step: float = 0.0
+    step_decimals: int = 0
+    # Integer view of the LOT_SIZE grid: quantities are compared as multiples of 10**-step_exp
+    step_exp: int = 0
+    step_units: int = 0
+    min_qty_units: int = 0
+    min_price: float = 0.0
+    max_price: float = math.inf
+    tick: float = 0.0
+    # Integer view of the PRICE_FILTER grid: prices are compared as multiples of 10**-tick_exp
+    tick_exp: int = 0
+    tick_units: int = 0
+    min_notional: float = 0.0
+    max_notional: float = math.inf
+    bid_up: float = math.inf
+    bid_down: float = 0.0
+    ask_up: float = math.inf
+    ask_down: float = 0.0
+
+    @classmethod
+    def from_filters(cls, filters: dict[str, Any]) -> "SymbolSpec":
+        """Build a spec from exchange filters keyed by `filterType`.
+
+        Args:
+            filters: Mapping of filter type (e.g. 'LOT_SIZE') to the raw filter dict.
+
+        Returns:
+            Parsed SymbolSpec.
+        """
+        lot_filter = filters.get("LOT_SIZE") or {}
+        price_filter = filters.get("PRICE_FILTER") or {}
+        notional_filter = filters.get("NOTIONAL") or {}
+        percent_filter = filters.get("PERCENT_PRICE_BY_SIDE")
+
+        min_qty_raw = lot_filter.get("minQty", 0)
+        step_raw = lot_filter.get("stepSize", 0)
+        tick_raw = price_filter.get("tickSize", 0)
+        min_qty_mantissa, min_qty_scale = _mantissa(min_qty_raw)
+        step_mantissa, step_scale = _mantissa(step_raw)
+        tick_mantissa, tick_exp = _mantissa(tick_raw)
+        step_exp = max(step_scale, min_qty_scale)
+        bounds: dict[str, float] = {}
+        if percent_filter:
+            bounds = {
+                "bid_up": float(percent_filter.get("bidMultiplierUp", 5)),
+                "bid_down": float(percent_filter.get("bidMultiplierDown", 0.2)),
+                "ask_up": float(percent_filter.get("askMultiplierUp", 5)),
+                "ask_down": float(percent_filter.get("askMultiplierDown", 0.2)),
+            }
+
+        return cls(
+            min_qty=float(min_qty_raw),
+            max_qty=float(lot_filter.get("maxQty", math.inf)),
+            step=float(step_raw),
+            step_decimals=step_scale,
+            step_exp=step_exp,
+            step_units=_rescale(step_mantissa, step_scale, step_exp),
+            min_qty_units=_rescale(min_qty_mantissa, min_qty_scale, step_exp),
+            min_price=float(price_filter.get("minPrice", 0)),
+            max_price=float(price_filter.get("maxPrice", math.inf)),
+            tick=float(tick_raw),
+            tick_exp=tick_exp,
+            tick_units=tick_mantissa,
+            min_notional=float(notional_filter.get("minNotional", 0)),
+            max_notional=float(notional_filter.get("maxNotional", math.inf)),
+            **bounds,
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class OrderSpec:
+    """Parameters of one order submitted to `OrderValidator.validate_order_placement_batch`."""
+
+    symbol: str
+    side: OrderSide
+    order_type: OrderType
+    quantity: float
+    price: float | None = None
+    stop_price: float | None = None
+
+
+class _TickerCache:
+    """Short-lived snapshot of `get_all_tickers` shared by consecutive price lookups."""
+
+    __slots__ = ("expires", "table")
+
+    def __init__(self) -> None:
+        self.expires = 0.0
+        self.table: dict[str, float] = {}
+
 
 class OrderValidator:
     """Validates orders against exchange filters before placement."""
 
-    def __init__(self, client: BinanceClient):
+    def __init__(self, client: BinanceClient, exchange_info_ttl: float = EXCHANGE_INFO_TTL_SECONDS):
         """Initialize the OrderValidator.
 
         Args:
             client: BinanceClient instance for API calls.
+            exchange_info_ttl: Seconds that per-symbol exchange info is reused before refetching.
         """
         self._client = client
+        self._exchange_info_ttl = exchange_info_ttl
+        self._ticker_cache = _TickerCache()
+        self._symbol_info_cache: dict[str, tuple[float, dict[str, Any]]] = {}
+        self._symbol_spec_cache: dict[str, tuple[float, SymbolSpec]] = {}
+        self._display_cache: dict[str, tuple[float, str]] = {}
+        # Type-specific checks; order types without an entry only get the balance check
+        self._dispatch: dict[OrderType, Callable[[str, OrderSide, float, float | None, float | None, float], tuple[bool, list[str]]]] = {
+            OrderType.OCO: self._validate_oco_path,
+            OrderType.LIMIT: self._validate_limit_path,
+            OrderType.MARKET: self._validate_market_path,
+        }
+
+    def invalidate_cache(self) -> None:
+        """Drop cached exchange info, parsed filters, display strings and the ticker snapshot.
+
+        Call this after symbol listings or filters change to force fresh data on the next validation.
+        The client's own exchange-info cache is cleared too, so the next lookup reaches the API.
+        """
+        self._symbol_info_cache.clear()
+        self._symbol_spec_cache.clear()
+        self._display_cache.clear()
+        self._ticker_cache = _TickerCache()
+        self._client.clear_exchange_info_cache()
 
     def validate_order_placement(
         self,
@@ -49,37 +287,10 @@ class OrderValidator:
         errors: list[str] = []
 
         try:
-            # Get current market price
-            current_price = self._get_current_price(symbol)
-            if not current_price:
-                errors.append(f"Could not retrieve current price for {symbol}")
+            current_price, errors = self._validate_order_rules(symbol, side, order_type, quantity, price, stop_price)
+            if current_price is None:
                 return False, errors
 
-            # 1. Market Price Validation (prevent immediate fills)
-            immediate_fill_errors = self._validate_immediate_fill_risk(side, order_type, price, stop_price, current_price)
-            errors.extend(immediate_fill_errors)
-
-            # 2. Route to specific validation based on order type
-            if order_type == OrderType.OCO:
-                if price is None or stop_price is None:
-                    errors.append("Price and stop_price are required for OCO orders")
-                    return False, errors
-                oco_valid, oco_errors = self.validate_oco_order(symbol, quantity, price, stop_price)
-                if not oco_valid:
-                    errors.extend(oco_errors)
-            elif order_type == OrderType.LIMIT:
-                if price is None:
-                    errors.append("Price is required for LIMIT orders")
-                    return False, errors
-                limit_valid, limit_errors = self.validate_limit_order(symbol, side, quantity, price)
-                if not limit_valid:
-                    errors.extend(limit_errors)
-            # MARKET orders don't need price validation but should check quantities
-            elif order_type == OrderType.MARKET:
-                market_valid, market_errors = self._validate_market_order_constraints(symbol, quantity)
-                if not market_valid:
-                    errors.extend(market_errors)
-
             # 3. Always validate available balance for all order types
             balance_valid, balance_errors = self._validate_available_balance(symbol, side, quantity, price, current_price)
             if not balance_valid:
@@ -90,10 +301,141 @@ class OrderValidator:
 
         return len(errors) == 0, errors
 
+    def validate_order_placement_batch(self, orders: Sequence[OrderSpec]) -> list[tuple[bool, list[str]]]:
+        """Validate several orders, fetching each required balance once.
+
+        Every order gets the same checks as `validate_order_placement`. Orders are grouped by the
+        asset they spend, so each asset's effective balance is fetched once. Valid orders then
+        reserve their share of that balance in submission order, so later orders only see what
+        is left.
+
+        Args:
+            orders: Orders to validate, in submission order.
+
+        Returns:
+            One (is_valid, list_of_errors) tuple per order, in the same order.
+        """
+        results: list[list[str]] = []
+        current_prices: dict[int, float] = {}
+        pending: defaultdict[str, list[tuple[int, float]]] = defaultdict(list)
+
+        for index, order in enumerate(orders):
+            try:
+                current_price, errors = self._validate_order_rules(order.symbol, order.side, order.order_type, order.quantity, order.price, order.stop_price)
+                if current_price is not None:
+                    asset, required = self._required_balance(order.symbol, order.side, order.quantity, order.price, current_price)
+                    pending[asset].append((index, required))
+                    current_prices[index] = current_price
+            except Exception as e:
+                errors = [f"Order validation error: {str(e)}"]
+            results.append(errors)
+
+        if pending:
+            # Import here to avoid circular dependency
+            from core.account import AccountService
+
+            account_service = AccountService(self._client)
+
+            for asset, entries in pending.items():
+                try:
+                    available_balance, commitments = account_service.get_effective_available_balance(asset)
+                except Exception as e:
+                    for index, _ in entries:
+                        results[index].append(f"Balance validation error: {str(e)}")
+                    continue
+
+                for index, required in entries:
+                    order = orders[index]
+                    balance_errors = self._check_balance(
+                        order.symbol, order.side, order.quantity, order.price, current_prices[index], available_balance, commitments
+                    )
+                    results[index].extend(balance_errors)
+                    if not results[index]:
+                        available_balance -= required
+
+        return [(len(errors) == 0, errors) for errors in results]
+
+    def _validate_order_rules(
+        self,
+        symbol: str,
+        side: OrderSide,
+        order_type: OrderType,
+        quantity: float,
+        price: float | None,
+        stop_price: float | None,
+    ) -> tuple[float | None, list[str]]:
+        """Run every order check except the balance check.
+
+        Returns:
+            Tuple of (current_price, errors); current_price is None when the order is rejected
+            outright and must not go on to the balance check.
+        """
+        errors: list[str] = []
+
+        # Get current market price
+        current_price = self._get_current_price(symbol)
+        if not current_price:
+            errors.append(f"Could not retrieve current price for {symbol}")
+            return None, errors
+
+        # 1. Market Price Validation (prevent immediate fills)
+        # This is a local comparison, so reject before any exchange-info or balance lookups
+        immediate_fill_errors = self._validate_immediate_fill_risk(side, order_type, price, stop_price, current_price)
+        if immediate_fill_errors:
+            errors.extend(immediate_fill_errors)
+            return None, errors
+
+        # 2. Route to specific validation based on order type
+        handler = self._dispatch.get(order_type)
+        if handler is not None:
+            proceed, type_errors = handler(symbol, side, quantity, price, stop_price, current_price)
+            errors.extend(type_errors)
+            if not proceed:
+                return None, errors
+
+        return current_price, errors
+
+    def _validate_oco_path(
+        self, symbol: str, side: OrderSide, quantity: float, price: float | None, stop_price: float | None, current_price: float
+    ) -> tuple[bool, list[str]]:
+        """Run OCO checks for `validate_order_placement`.
+
+        Returns:
+            Tuple of (proceed, errors); proceed is False when required prices are missing.
+        """
+        if price is None or stop_price is None:
+            return False, ["Price and stop_price are required for OCO orders"]
+        return True, self.validate_oco_order(symbol, quantity, price, stop_price, current_price=current_price)[1]
+
+    def _validate_limit_path(
+        self, symbol: str, side: OrderSide, quantity: float, price: float | None, stop_price: float | None, current_price: float
+    ) -> tuple[bool, list[str]]:
+        """Run LIMIT checks for `validate_order_placement`.
+
+        Returns:
+            Tuple of (proceed, errors); proceed is False when the price is missing.
+        """
+        if price is None:
+            return False, ["Price is required for LIMIT orders"]
+        return True, self.validate_limit_order(symbol, side, quantity, price, current_price=current_price)[1]
+
+    def _validate_market_path(
+        self, symbol: str, side: OrderSide, quantity: float, price: float | None, stop_price: float | None, current_price: float
+    ) -> tuple[bool, list[str]]:
+        """Run MARKET checks for `validate_order_placement`.
+
+        MARKET orders don't need price validation but should check quantities.
+
+        Returns:
+            Tuple of (proceed, errors); MARKET orders always proceed to the balance check.
+        """
+        return True, self._validate_market_order_constraints(symbol, quantity, current_price=current_price)[1]
+
     def get_lot_size_info_display(self, symbol: str) -> str:
         """Get user-friendly lot size information for a symbol.
 
-        This replaces the need for manual 'exchange lotsize' commands.
+        This replaces the need for manual 'exchange lotsize' commands. Successful results are
+        cached per symbol for `DISPLAY_CACHE_TTL_SECONDS`; error messages are never cached.
 
         Args:
             symbol: Trading symbol (e.g., 'ETHUSDT').
@@ -101,17 +443,17 @@ class OrderValidator:
         Returns:
             Formatted string with lot size information.
         """
+        cached = self._display_cache.get(symbol)
+        if cached and time.monotonic() < cached[0]:
+            return cached[1]
+
         try:
-            symbol_info_raw = self._client.get_exchange_info(symbol)
-            if not symbol_info_raw:
+            symbol_data = self._get_symbol_info(symbol)
+            if symbol_data is None:
                 return f"❌ Could not retrieve lot size info for {symbol}"
-
-            symbol_info = cast(dict[str, Any], symbol_info_raw)
-            symbols_list = symbol_info.get("symbols", [])
-            if not symbols_list:
+            if not symbol_data:
                 return f"❌ No symbol information found for {symbol}"
 
-            symbol_data = symbols_list[0]
             filters = {f["filterType"]: f for f in symbol_data.get("filters", [])}
             lot_filter = filters.get("LOT_SIZE")
             price_filter = filters.get("PRICE_FILTER")
@@ -155,7 +497,9 @@ class OrderValidator:
                 lines.append(f"   • PRICE_FILTER Tick Size: {tick_size} ({price_decimals} decimal places)")
                 lines.append(f"   • Example Valid Prices: {', '.join(example_prices)}")
 
-            return "\n".join(lines)
+            display = "\n".join(lines)
+            self._display_cache[symbol] = (time.monotonic() + DISPLAY_CACHE_TTL_SECONDS, display)
+            return display
 
         except Exception as e:
             return f"❌ Error retrieving lot size info for {symbol}: {str(e)}"
@@ -180,28 +524,16 @@ class OrderValidator:
 
         if order_type == OrderType.LIMIT and price is not None:
             if side == OrderSide.SELL and price <= current_price:
-                errors.append(
-                    f"🚨 CRITICAL: SELL LIMIT at ${price:,.2f} would fill IMMEDIATELY "
-                    + f"(current price: ${current_price:,.2f}). For profit-taking, use price > ${current_price:,.2f}"
-                )
+                errors.append(CodedValidationError(ValidationErrorCode.IMMEDIATE_SELL_LIMIT, price=price, current=current_price))
             elif side == OrderSide.BUY and price >= current_price:
-                errors.append(
-                    f"🚨 CRITICAL: BUY LIMIT at ${price:,.2f} would fill IMMEDIATELY "
-                    + f"(current price: ${current_price:,.2f}). For accumulation, use price < ${current_price:,.2f}"
-                )
+                errors.append(CodedValidationError(ValidationErrorCode.IMMEDIATE_BUY_LIMIT, price=price, current=current_price))
 
         if order_type == OrderType.OCO:
             # For OCO orders (SELL side protection), both limits must be on correct sides
             if price is not None and price <= current_price:
-                errors.append(
-                    f"🚨 CRITICAL: OCO limit price ${price:,.2f} would fill IMMEDIATELY "
-                    + f"(current price: ${current_price:,.2f}). Take-profit must be > ${current_price:,.2f}"
-                )
+                errors.append(CodedValidationError(ValidationErrorCode.IMMEDIATE_OCO_LIMIT, price=price, current=current_price))
             if stop_price is not None and stop_price >= current_price:
-                errors.append(
-                    f"🚨 CRITICAL: OCO stop price ${stop_price:,.2f} would trigger IMMEDIATELY "
-                    + f"(current price: ${current_price:,.2f}). Stop-loss must be < ${current_price:,.2f}"
-                )
+                errors.append(CodedValidationError(ValidationErrorCode.IMMEDIATE_OCO_STOP, price=stop_price, current=current_price))
 
         return errors
 
@@ -226,55 +558,65 @@ class OrderValidator:
 
             account_service = AccountService(self._client)
 
-            base_asset, quote_asset = self._get_symbol_assets(symbol)
-
-            if side == OrderSide.BUY:
-                # For BUY orders, need enough quote currency
-                effective_price = price if price else current_price
-                required_amount = quantity * effective_price
-
-                available_balance, commitments = account_service.get_effective_available_balance(quote_asset)
-
-                if available_balance < required_amount:
-                    errors.append(
-                        f"Insufficient effective {quote_asset} balance: have ${available_balance:,.2f} available "
-                        + f"(${commitments.get('buy_orders', 0):,.2f} committed to buy orders), "
-                        + f"need ${required_amount:,.2f} for {quantity} {symbol} at ${effective_price:,.2f}"
-                    )
-
-            else:  # OrderSide.SELL
-                # For SELL orders, need enough of the base asset
-                available_balance, commitments = account_service.get_effective_available_balance(base_asset)
-
-                if available_balance < quantity:
-                    errors.append(
-                        f"Insufficient effective {base_asset} balance: have {available_balance:,.8f} available "
-                        + f"({commitments.get('sell_orders', 0):,.8f} committed to sell orders, "
-                        + f"{commitments.get('oco_orders', 0):,.8f} in OCO orders), "
-                        + f"need {quantity:,.8f} to sell"
-                    )
+            asset, _ = self._required_balance(symbol, side, quantity, price, current_price)
+            available_balance, commitments = account_service.get_effective_available_balance(asset)
+            errors.extend(self._check_balance(symbol, side, quantity, price, current_price, available_balance, commitments))
 
         except Exception as e:
             errors.append(f"Balance validation error: {str(e)}")
 
         return len(errors) == 0, errors
 
+    def _required_balance(self, symbol: str, side: OrderSide, quantity: float, price: float | None, current_price: float) -> tuple[str, float]:
+        """Return the asset an order spends and how much of it the order needs."""
+        base_asset, quote_asset = self._get_symbol_assets(symbol)
+        if side == OrderSide.BUY:
+            # For BUY orders, need enough quote currency
+            return quote_asset, quantity * (price if price else current_price)
+        # For SELL orders, need enough of the base asset
+        return base_asset, quantity
+
+    def _check_balance(
+        self,
+        symbol: str,
+        side: OrderSide,
+        quantity: float,
+        price: float | None,
+        current_price: float,
+        available_balance: float,
+        commitments: dict[str, float],
+    ) -> list[str]:
+        """Compare an order's requirement with an already fetched effective balance."""
+        asset, required_amount = self._required_balance(symbol, side, quantity, price, current_price)
+        if available_balance >= required_amount:
+            return []
+
+        if side == OrderSide.BUY:
+            effective_price = price if price else current_price
+            return [
+                f"Insufficient effective {asset} balance: have ${available_balance:,.2f} available "
+                + f"(${commitments.get('buy_orders', 0):,.2f} committed to buy orders), "
+                + f"need ${required_amount:,.2f} for {quantity} {symbol} at ${effective_price:,.2f}"
+            ]
+        return [
+            f"Insufficient effective {asset} balance: have {available_balance:,.8f} available "
+            + f"({commitments.get('sell_orders', 0):,.8f} committed to sell orders, "
+            + f"{commitments.get('oco_orders', 0):,.8f} in OCO orders), "
+            + f"need {quantity:,.8f} to sell"
+        ]
+
     def _get_symbol_assets(self, symbol: str) -> tuple[str, str]:
         """Return (base_asset, quote_asset) for a trading symbol.
 
         Attempts to read from exchange info; falls back to suffix parsing.
         """
         try:
-            symbol_info_raw = self._client.get_exchange_info(symbol)
-            if symbol_info_raw:
-                info = cast(dict[str, Any], symbol_info_raw)
-                symbols_list = info.get("symbols", [])
-                if symbols_list:
-                    data = symbols_list[0]
-                    base = cast(str, data.get("baseAsset", ""))
-                    quote = cast(str, data.get("quoteAsset", ""))
-                    if base and quote:
-                        return base, quote
+            data = self._get_symbol_info(symbol)
+            if data:
+                base = cast(str, data.get("baseAsset", ""))
+                quote = cast(str, data.get("quoteAsset", ""))
+                if base and quote:
+                    return base, quote
         except Exception:
             # Ignore and fallback
             pass
@@ -290,47 +632,87 @@ class OrderValidator:
         # Last resort: assume USDT quote
         return symbol.replace("USDT", ""), "USDT"
 
-    def _get_symbol_validation_data(self, symbol: str) -> tuple[dict[str, Any] | None, float | None, list[str]]:
-        """Get symbol information and current price for validation.
+    def _get_symbol_info(self, symbol: str) -> dict[str, Any] | None:
+        """Get the exchange-info entry for a symbol, cached for the exchange-info TTL.
+
+        Every symbol in the response is indexed, so later lookups are a dict hit.
+
+        Returns:
+            The symbol entry, an empty dict if the response lists no symbols, or None if
+            no exchange info could be retrieved. API errors propagate to the caller.
+        """
+        now = time.monotonic()
+        cached = self._symbol_info_cache.get(symbol)
+        if cached and now < cached[0]:
+            return cached[1]
+        if cached:
+            # The client caches exchange info for longer than our TTL, so drop its copy to really refetch
+            self._client.clear_exchange_info_cache(symbol)
+
+        symbol_info_raw = self._client.get_exchange_info(symbol)
+        if not symbol_info_raw:
+            return None
+
+        # Work with the API response as raw dict to avoid TypedDict issues
+        symbols_list = cast(dict[str, Any], symbol_info_raw).get("symbols", [])
+        if not symbols_list:
+            return {}
+
+        expires = now + self._exchange_info_ttl
+        for entry in symbols_list:
+            if entry.get("symbol"):
+                self._symbol_info_cache[entry["symbol"]] = (expires, entry)
+        # The endpoint was queried for this symbol, so its entry comes first
+        self._symbol_info_cache[symbol] = (expires, symbols_list[0])
+        return cast(dict[str, Any], symbols_list[0])
+
+    def _get_symbol_validation_data(self, symbol: str, current_price: float | None = None) -> tuple[SymbolSpec | None, float | None, list[str]]:
+        """Get parsed exchange filters and current price for validation.
+
+        Parsed filters are cached per symbol for the exchange-info TTL. The current price is
+        only looked up when the caller has not already fetched it.
 
         Returns:
-            Tuple of (filters_dict, current_price, errors).
+            Tuple of (symbol_spec, current_price, errors).
         """
         errors: list[str] = []
 
         try:
-            # Get symbol info and current price
-            symbol_info_raw = self._client.get_exchange_info(symbol)
-            current_price = self._get_current_price(symbol)
+            cached = self._symbol_spec_cache.get(symbol)
+            if cached and time.monotonic() < cached[0]:
+                spec: SymbolSpec | None = cached[1]
+            else:
+                spec = None
+                symbol_data = self._get_symbol_info(symbol)
+                if symbol_data is not None:
+                    if not symbol_data:
+                        errors.append("No symbol information found")
+                        return None, None, errors
 
-            if not symbol_info_raw or not current_price:
-                errors.append("Could not retrieve symbol information or current price")
-                return None, None, errors
+                    filters = {f["filterType"]: f for f in symbol_data.get("filters", [])}
+                    spec = SymbolSpec.from_filters(filters)
+                    self._symbol_spec_cache[symbol] = (time.monotonic() + self._exchange_info_ttl, spec)
 
-            # Work with the API response as raw dict to avoid TypedDict issues
-            symbol_info = cast(dict[str, Any], symbol_info_raw)
-            symbols_list = symbol_info.get("symbols", [])
-            if not symbols_list:
-                errors.append("No symbol information found")
-                return None, None, errors
+            if current_price is None:
+                current_price = self._get_current_price(symbol)
 
-            symbol_data = symbols_list[0]
-            # Extract filters as dict - no need to cast filterType since it's already str
-            filters = {f["filterType"]: f for f in symbol_data.get("filters", [])}
+            if spec is None or not current_price:
+                errors.append("Could not retrieve symbol information or current price")
+                return None, None, errors
 
-            return filters, current_price, errors
+            return spec, current_price, errors
 
         except Exception as e:
             errors.append(f"Symbol validation data error: {str(e)}")
             return None, None, errors
 
-    def _validate_exchange_constraints(self, quantity: float, prices: list[float], filters: dict[str, Any], current_price: float, side: OrderSide) -> list[str]:
+    def _validate_exchange_constraints(self, quantity: float, prices: Sequence[float], spec: SymbolSpec, current_price: float, side: OrderSide) -> list[str]:
         """Validate common exchange constraints for all order types.
 
         Args:
             quantity: Order quantity.
             prices: List of prices to validate.
-            filters: Exchange filters dict.
+            spec: Parsed exchange filters for the symbol.
             current_price: Current market price.
             side: Order side.
 
@@ -340,37 +722,37 @@ class OrderValidator:
         errors: list[str] = []
 
         # Validate LOT_SIZE
-        lot_errors = self._validate_lot_size(quantity, filters.get("LOT_SIZE"))
+        lot_errors = self._validate_lot_size(quantity, spec)
         errors.extend(lot_errors)
 
         # Validate PRICE_FILTER
-        price_errors = self._validate_price_filter(prices, filters.get("PRICE_FILTER"))
+        price_errors = self._validate_price_filter(prices, spec)
         errors.extend(price_errors)
 
         # Validate PERCENT_PRICE_BY_SIDE
-        percent_errors = self._validate_percent_price(prices, current_price, filters.get("PERCENT_PRICE_BY_SIDE"), side)
+        percent_errors = self._validate_percent_price(prices, current_price, spec, side)
         errors.extend(percent_errors)
 
         # Validate NOTIONAL
-        notional_errors = self._validate_notional(quantity, prices, filters.get("NOTIONAL"))
+        notional_errors = self._validate_notional(quantity, prices, spec)
         errors.extend(notional_errors)
 
         return errors
 
-    def _validate_market_order_constraints(self, symbol: str, quantity: float) -> tuple[bool, list[str]]:
+    def _validate_market_order_constraints(self, symbol: str, quantity: float, current_price: float | None = None) -> tuple[bool, list[str]]:
         """Validate market order against basic exchange constraints."""
         errors: list[str] = []
 
         try:
             # Use consolidated method to get validation data
-            filters, current_price, setup_errors = self._get_symbol_validation_data(symbol)
+            spec, current_price, setup_errors = self._get_symbol_validation_data(symbol, current_price)
             errors.extend(setup_errors)
 
-            if not filters or not current_price:
+            if spec is None or not current_price:
                 return False, errors
 
             # For market orders, only validate LOT_SIZE (no price constraints)
-            lot_errors = self._validate_lot_size(quantity, filters.get("LOT_SIZE"))
+            lot_errors = self._validate_lot_size(quantity, spec)
             errors.extend(lot_errors)
 
         except Exception as e:
@@ -384,14 +766,19 @@ class OrderValidator:
         quantity: float,
         limit_price: float,
         stop_price: float,
+        *,
+        current_price: float | None = None,
     ) -> tuple[bool, list[str]]:
         """Validate OCO order parameters against exchange constraints.
 
+        The current price is fetched once and used for every OCO price check.
+
         Args:
             symbol: Trading symbol (e.g., 'ETHUSDT').
             quantity: Order quantity.
             limit_price: Take-profit price.
             stop_price: Stop-loss price.
+            current_price: Current price already fetched by the caller; looked up when omitted.
 
         Returns:
             Tuple of (is_valid, list_of_errors).
@@ -400,10 +787,10 @@ class OrderValidator:
 
         try:
             # Use consolidated method to get validation data
-            filters, current_price, setup_errors = self._get_symbol_validation_data(symbol)
+            spec, current_price, setup_errors = self._get_symbol_validation_data(symbol, current_price)
             errors.extend(setup_errors)
 
-            if not filters or not current_price:
+            if spec is None or not current_price:
                 return False, errors
 
             # Validate OCO-specific price logic (SELL side)
@@ -420,7 +807,7 @@ class OrderValidator:
             constraint_errors = self._validate_exchange_constraints(
                 quantity=quantity,
                 prices=[limit_price, stop_price],
-                filters=filters,
+                spec=spec,
                 current_price=current_price,
                 side=OrderSide.SELL,  # OCO orders are SELL side in this implementation
             )
@@ -437,6 +824,8 @@ class OrderValidator:
         side: OrderSide,
         quantity: float,
         price: float,
+        *,
+        current_price: float | None = None,
     ) -> tuple[bool, list[str]]:
         """Validate limit order parameters against exchange constraints.
 
@@ -445,6 +834,7 @@ class OrderValidator:
             side: Order side (BUY or SELL).
             quantity: Order quantity.
             price: Order price.
+            current_price: Current price already fetched by the caller; looked up when omitted.
 
         Returns:
             Tuple of (is_valid, list_of_errors).
@@ -453,14 +843,14 @@ class OrderValidator:
 
         try:
             # Use consolidated method to get validation data
-            filters, current_price, setup_errors = self._get_symbol_validation_data(symbol)
+            spec, current_price, setup_errors = self._get_symbol_validation_data(symbol, current_price)
             errors.extend(setup_errors)
 
-            if not filters or not current_price:
+            if spec is None or not current_price:
                 return False, errors
 
             # Use consolidated method for exchange constraints
-            constraint_errors = self._validate_exchange_constraints(quantity=quantity, prices=[price], filters=filters, current_price=current_price, side=side)
+            constraint_errors = self._validate_exchange_constraints(quantity=quantity, prices=[price], spec=spec, current_price=current_price, side=side)
             errors.extend(constraint_errors)
 
         except Exception as e:
@@ -469,157 +859,122 @@ class OrderValidator:
         return len(errors) == 0, errors
 
     def _get_current_price(self, symbol: str) -> float | None:
-        """Get current price for a symbol."""
+        """Get current price for a symbol.
+
+        A fresh ticker snapshot is reused for up to `TICKER_CACHE_TTL_SECONDS`, so a burst of
+        validations does not download the full ticker list once per order. Otherwise, or when
+        the snapshot lacks the symbol, the single-symbol price endpoint is preferred and the full
+        ticker list is only fetched when that endpoint yields nothing.
+        """
         try:
-            # Prefer a direct price method if available
-            price_value: float | None = None
-            try:
-                get_price = getattr(self._client, "get_price", None)
-                if callable(get_price):
-                    candidate = get_price(symbol)
-                    # Only accept primitive numeric or string types; ignore MagicMock or other objects
-                    if isinstance(candidate, int | float | str):
-                        try:
-                            price_value = float(candidate)
-                        except (TypeError, ValueError):
-                            price_value = None
-                    else:
-                        price_value = None
-            except Exception:
-                price_value = None
-
-            if price_value is not None:
+            snapshot_fresh = time.monotonic() < self._ticker_cache.expires
+            if snapshot_fresh:
+                cached_price = self._ticker_cache.table.get(symbol)
+                if cached_price is not None:
+                    return cached_price
+
+            price_value = self._get_single_symbol_price(symbol)
+            if price_value is not None or snapshot_fresh:
+                # A fresh snapshot already lacks the symbol, so refetching it would not help
                 return price_value
 
-            # Fallback to scanning all tickers
+            # Fallback to a fresh snapshot of all tickers, indexed by symbol once
             tickers = self._client.get_all_tickers()
-            for ticker in tickers:
-                if ticker["symbol"] == symbol:
-                    return float(ticker["price"])
+            self._ticker_cache.table = {ticker["symbol"]: float(ticker["price"]) for ticker in tickers}
+            self._ticker_cache.expires = time.monotonic() + TICKER_CACHE_TTL_SECONDS
+            return self._ticker_cache.table.get(symbol)
+        except Exception:
+            return None
+
+    def _get_single_symbol_price(self, symbol: str) -> float | None:
+        """Query the single-symbol price endpoint, returning None when it is unusable."""
+        get_price = getattr(self._client, "get_price", None)
+        if not callable(get_price):
             return None
+        try:
+            candidate = get_price(symbol)
         except Exception:
             return None
+        # Only accept primitive numeric or string types; ignore MagicMock or other objects
+        if not isinstance(candidate, int | float | str):
+            return None
+        try:
+            return float(candidate)
+        except (TypeError, ValueError):
+            return None
 
-    def _validate_lot_size(self, quantity: float, lot_filter: dict[str, Any] | None) -> list[str]:
+    def _validate_lot_size(self, quantity: float, spec: SymbolSpec) -> list[str]:
         """Validate quantity against LOT_SIZE filter with user-friendly error messages."""
         errors: list[str] = []
-        if not lot_filter:
-            return errors
-
-        # Use Decimal for robust precision math
-        from decimal import ROUND_DOWN, Decimal
-
-        min_qty = float(lot_filter.get("minQty", 0))
-        max_qty = float(lot_filter.get("maxQty", float("inf")))
-        step_size = float(lot_filter.get("stepSize", 0))
-
-        # Calculate decimal places for user-friendly formatting
-        step_str = str(step_size)
-        if "." in step_str:
-            decimal_places = len(step_str.split(".")[1].rstrip("0"))
-        else:
-            decimal_places = 0
-
-        if quantity < min_qty:
-            errors.append(f"❌ QUANTITY TOO SMALL: {quantity} below minimum {min_qty} (exchange requirement)")
-        if quantity > max_qty:
-            errors.append(f"❌ QUANTITY TOO LARGE: {quantity} above maximum {max_qty} (exchange requirement)")
-        if step_size > 0:
-            # Decimal-based alignment check
-            q_dec = Decimal(str(quantity))
-            min_dec = Decimal(str(min_qty))
-            step_dec = Decimal(str(step_size))
-            steps_dec = ((q_dec - min_dec) / step_dec).quantize(Decimal("1"), rounding=ROUND_DOWN)
-            aligned_dec = steps_dec * step_dec + min_dec
-            if aligned_dec != q_dec:
-                # Suggest aligned quantity via central formatter
-                try:
-                    symbol_for_format = cast(str, None)  # Placeholder for format context if available
-                except Exception:
-                    symbol_for_format = None  # Defensive fallback
-
-                suggested_qty: float
-                if symbol_for_format:
-                    formatter = PrecisionFormatter(self._client)
-                    suggested_qty = formatter.format_quantity(symbol_for_format, quantity)
-                else:
-                    # Fallback: use computed aligned value
-                    suggested_qty = float(aligned_dec)
 
+        if quantity < spec.min_qty:
+            errors.append(CodedValidationError(ValidationErrorCode.LOT_MIN, quantity=quantity, min_qty=spec.min_qty))
+        if quantity > spec.max_qty:
+            errors.append(CodedValidationError(ValidationErrorCode.LOT_MAX, quantity=quantity, max_qty=spec.max_qty))
+        if spec.step_units > 0:
+            # Exact alignment check on integer units: (quantity - minQty) % stepSize == 0
+            units, exact = _scaled_units(quantity, spec.step_exp)
+            aligned_units = units - (units - spec.min_qty_units) % spec.step_units
+            if not exact or aligned_units != units:
                 errors.append(
-                    f"❌ PRECISION ERROR: Quantity {quantity} not aligned with step size {step_size} "
-                    + f"({decimal_places} decimal places). SUGGESTED: {suggested_qty:.{decimal_places}f}"
+                    CodedValidationError(
+                        ValidationErrorCode.LOT_STEP,
+                        quantity=quantity,
+                        step=spec.step,
+                        decimals=spec.step_decimals,
+                        suggested=aligned_units / 10**spec.step_exp,
+                    )
                 )
 
         return errors
 
-    def _validate_price_filter(self, prices: list[float], price_filter: dict[str, Any] | None) -> list[str]:
+    def _validate_price_filter(self, prices: Sequence[float], spec: SymbolSpec) -> list[str]:
         """Validate prices against PRICE_FILTER."""
         errors: list[str] = []
-        if not price_filter:
-            return errors
-
-        # Use Decimal for robust precision math
-        from decimal import ROUND_HALF_UP, Decimal
-
-        min_price = float(price_filter.get("minPrice", 0))
-        max_price = float(price_filter.get("maxPrice", float("inf")))
-        tick_size = float(price_filter.get("tickSize", 0))
 
         for price in prices:
-            if min_price > 0 and price < min_price:
-                errors.append(f"Price ${price:,.8f} below minimum ${min_price:,.8f}")
-            if max_price > 0 and price > max_price:
-                errors.append(f"Price ${price:,.8f} above maximum ${max_price:,.8f}")
-            if tick_size > 0:
-                # Decimal-based tick alignment
-                p_dec = Decimal(str(price))
-                tick_dec = Decimal(str(tick_size))
-                ticks = (p_dec / tick_dec).quantize(Decimal("1"), rounding=ROUND_HALF_UP)
-                aligned = ticks * tick_dec
-                if aligned != p_dec:
-                    errors.append(f"Price ${price:,.8f} not aligned with tick size ${tick_size:,.8f}")
+            # A zero bound means the exchange has disabled that side of the filter
+            if spec.min_price > 0 and price < spec.min_price:
+                errors.append(CodedValidationError(ValidationErrorCode.PRICE_MIN, price=price, min_price=spec.min_price))
+            if spec.max_price > 0 and price > spec.max_price:
+                errors.append(CodedValidationError(ValidationErrorCode.PRICE_MAX, price=price, max_price=spec.max_price))
+            if spec.tick_units > 0:
+                # Exact tick alignment on integer units
+                units, exact = _scaled_units(price, spec.tick_exp)
+                if not exact or units % spec.tick_units != 0:
+                    errors.append(CodedValidationError(ValidationErrorCode.PRICE_TICK, price=price, tick=spec.tick))
 
         return errors
 
-    def _validate_percent_price(self, prices: list[float], current_price: float, percent_filter: dict[str, Any] | None, side: OrderSide) -> list[str]:
+    def _validate_percent_price(self, prices: Sequence[float], current_price: float, spec: SymbolSpec, side: OrderSide) -> list[str]:
         """Validate prices against PERCENT_PRICE_BY_SIDE filter."""
         errors: list[str] = []
-        if not percent_filter:
-            return errors
 
         if side == OrderSide.BUY:
-            multiplier_up = float(percent_filter.get("bidMultiplierUp", 5))
-            multiplier_down = float(percent_filter.get("bidMultiplierDown", 0.2))
+            multiplier_up, multiplier_down = spec.bid_up, spec.bid_down
         else:  # SELL
-            multiplier_up = float(percent_filter.get("askMultiplierUp", 5))
-            multiplier_down = float(percent_filter.get("askMultiplierDown", 0.2))
+            multiplier_up, multiplier_down = spec.ask_up, spec.ask_down
 
         max_price = current_price * multiplier_up
         min_price = current_price * multiplier_down
 
         for price in prices:
             if price > max_price:
-                errors.append(f"Price ${price:,.2f} above {side.value} limit ${max_price:,.2f} ({multiplier_up}x current)")
+                errors.append(CodedValidationError(ValidationErrorCode.PERCENT_UP, price=price, side=side.value, limit=max_price, multiplier=multiplier_up))
             if price < min_price:
-                errors.append(f"Price ${price:,.2f} below {side.value} limit ${min_price:,.2f} ({multiplier_down}x current)")
+                errors.append(CodedValidationError(ValidationErrorCode.PERCENT_DOWN, price=price, side=side.value, limit=min_price, multiplier=multiplier_down))
 
         return errors
 
-    def _validate_notional(self, quantity: float, prices: list[float], notional_filter: dict[str, Any] | None) -> list[str]:
+    def _validate_notional(self, quantity: float, prices: Sequence[float], spec: SymbolSpec) -> list[str]:
         """Validate notional value against NOTIONAL filter."""
         errors: list[str] = []
-        if not notional_filter:
-            return errors
-
-        min_notional = float(notional_filter.get("minNotional", 0))
-        max_notional = float(notional_filter.get("maxNotional", float("inf")))
 
         for price in prices:
             notional = quantity * price
-            if notional < min_notional:
-                errors.append(f"Notional ${notional:,.2f} below minimum ${min_notional:,.2f}")
-            if notional > max_notional:
-                errors.append(f"Notional ${notional:,.2f} above maximum ${max_notional:,.2f}")
+            if notional < spec.min_notional:
+                errors.append(CodedValidationError(ValidationErrorCode.NOTIONAL_MIN, notional=notional, min_notional=spec.min_notional))
+            if notional > spec.max_notional:
+                errors.append(CodedValidationError(ValidationErrorCode.NOTIONAL_MAX, notional=notional, max_notional=spec.max_notional))
 
         return errors
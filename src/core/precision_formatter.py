@@ -1,25 +1,113 @@
 """Precision formatting utility for Binance order parameters."""
 
 import logging
-from decimal import ROUND_DOWN, Decimal
+import time
+from collections import OrderedDict
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from decimal import ROUND_DOWN, ROUND_HALF_UP, Decimal
+from types import MappingProxyType
 from typing import Any
 
 from api.client import BinanceClient
+from api.exceptions import APIError
+from api.models import ExchangeInfo, SymbolInfo
 
 logger = logging.getLogger(__name__)
 
+# How long the filters fetched for a symbol may be reused before exchange info is queried again
+SYMBOL_INFO_TTL_SECONDS = 300.0
+# How many formatted (symbol, value) results are kept; retries and OCO replays reformat the same values
+FORMAT_CACHE_SIZE = 4096
+
+_ONE = Decimal(1)
+_ZERO = Decimal(0)
+
+
+@dataclass(slots=True, frozen=True)
+class SymbolRules:
+    """LOT_SIZE and PRICE_FILTER sizes for one symbol, parsed straight from the filter strings.
+
+    A missing step or tick size is None; a missing minQty is zero.
+    """
+
+    step: Decimal | None
+    min_qty: Decimal
+    tick: Decimal | None
+
+    @classmethod
+    def from_filters(cls, filters: Mapping[str, Any]) -> "SymbolRules":
+        """Build rules from filters keyed by filterType, walking them once."""
+        lot_filter = filters.get("LOT_SIZE") or {}
+        price_filter = filters.get("PRICE_FILTER") or {}
+        return cls(
+            step=Decimal(lot_filter["stepSize"]) if "stepSize" in lot_filter else None,
+            min_qty=Decimal(lot_filter["minQty"]) if "minQty" in lot_filter else _ZERO,
+            tick=Decimal(price_filter["tickSize"]) if "tickSize" in price_filter else None,
+        )
+
+    def align_quantity(self, quantity: float) -> float:
+        """Round quantity down onto the step grid; returned unchanged when there is no step size."""
+        if not self.step:
+            return quantity
+        return float(self.align_quantity_decimal(quantity))
+
+    def align_price(self, price: float) -> float:
+        """Round price to the nearest tick, halves up; returned unchanged when there is no tick size."""
+        if not self.tick:
+            return price
+        return float(self.align_price_decimal(price))
+
+    def align_quantity_decimal(self, quantity: float) -> Decimal:
+        """Round quantity down onto the step grid, keeping the exact Decimal result."""
+        value = Decimal(str(quantity))
+        if not self.step:
+            return value
+
+        # Calculate aligned quantity: floor((qty - minQty) / stepSize) * stepSize + minQty
+        steps = ((value - self.min_qty) / self.step).quantize(_ONE, rounding=ROUND_DOWN)
+        return steps * self.step + self.min_qty
+
+    def align_price_decimal(self, price: float) -> Decimal:
+        """Round price to the nearest tick, halves up, keeping the exact Decimal result."""
+        value = Decimal(str(price))
+        if not self.tick:
+            return value
+
+        # Round to nearest tick, halves away from zero: round(price / tickSize) * tickSize
+        ticks = (value / self.tick).quantize(_ONE, rounding=ROUND_HALF_UP)
+        return ticks * self.tick
+
 
 class PrecisionFormatter:
     """Formats order quantities and prices to match Binance exchange constraints."""
 
-    def __init__(self, client: BinanceClient):
+    __slots__ = ("_client", "_symbol_info_ttl", "_symbol_cache", "_rules_cache", "_format_cache")
+
+    def __init__(self, client: BinanceClient, symbol_info_ttl: float = SYMBOL_INFO_TTL_SECONDS):
         """Initialize the PrecisionFormatter.
 
         Args:
             client: BinanceClient instance for API calls.
+            symbol_info_ttl: Seconds a symbol's filters are reused before they are refetched.
         """
         self._client = client
-        self._symbol_cache: dict[str, dict[str, Any]] = {}
+        self._symbol_info_ttl = symbol_info_ttl
+        # Read-only views of filters keyed by filterType, with the monotonic time they expire
+        self._symbol_cache: dict[str, tuple[float, Mapping[str, Any]]] = {}
+        self._rules_cache: dict[str, SymbolRules] = {}
+        # Least recently used first, keyed by (symbol, is_price, raw value), holding the rules the result came from
+        self._format_cache: OrderedDict[tuple[str, bool, float], tuple[SymbolRules, float]] = OrderedDict()
+
+    def invalidate_cache(self) -> None:
+        """Drop cached symbol filters so the next format call refetches exchange info.
+
+        The client's own exchange-info cache is cleared too, so the refetch reaches the API.
+        """
+        self._symbol_cache.clear()
+        self._rules_cache.clear()
+        self._format_cache.clear()
+        self._client.clear_exchange_info_cache()
 
     def format_quantity(self, symbol: str, quantity: float) -> float:
         """Format quantity to match LOT_SIZE step size.
@@ -31,25 +119,51 @@ class PrecisionFormatter:
         Returns:
             Formatted quantity aligned with step size.
         """
-        step_size = self._get_lot_size_step(symbol)
-        if not step_size:
-            return quantity
+        return self._format_cached(symbol, quantity, is_price=False)
 
-        # Use Decimal for precision
-        qty_decimal = Decimal(str(quantity))
-        step_decimal = Decimal(str(step_size))
+    def format_price(self, symbol: str, price: float) -> float:
+        """Format price to match PRICE_FILTER tick size.
 
-        # Calculate aligned quantity: floor((qty - minQty) / stepSize) * stepSize + minQty
-        min_qty = self._get_lot_size_min(symbol)
-        min_decimal = Decimal(str(min_qty))
+        Args:
+            symbol: Trading symbol (e.g., 'ETHUSDT').
+            price: Raw price value.
 
-        steps = ((qty_decimal - min_decimal) / step_decimal).quantize(Decimal("1"), rounding=ROUND_DOWN)
-        aligned_qty = steps * step_decimal + min_decimal
+        Returns:
+            Formatted price aligned with tick size.
+        """
+        return self._format_cached(symbol, price, is_price=True)
 
-        return float(aligned_qty)
+    def format_quantities(self, symbol: str, quantities: Iterable[float]) -> list[float]:
+        """Format a batch of quantities for one symbol with a single rules lookup.
 
-    def format_price(self, symbol: str, price: float) -> float:
-        """Format price to match PRICE_FILTER tick size.
+        Args:
+            symbol: Trading symbol (e.g., 'ETHUSDT').
+            quantities: Raw quantity values.
+
+        Returns:
+            Formatted quantities aligned with step size, in input order.
+        """
+        align = self._get_symbol_rules(symbol).align_quantity
+        return [align(quantity) for quantity in quantities]
+
+    def format_quantity_decimal(self, symbol: str, quantity: float) -> Decimal:
+        """Format quantity to match LOT_SIZE step size, without converting back to float.
+
+        The result stringifies exactly, e.g. for request parameters.
+
+        Args:
+            symbol: Trading symbol (e.g., 'ETHUSDT').
+            quantity: Raw quantity value.
+
+        Returns:
+            Formatted quantity aligned with step size.
+        """
+        return self._get_symbol_rules(symbol).align_quantity_decimal(quantity)
+
+    def format_price_decimal(self, symbol: str, price: float) -> Decimal:
+        """Format price to match PRICE_FILTER tick size, without converting back to float.
+
+        The result stringifies exactly, e.g. for request parameters.
 
         Args:
             symbol: Trading symbol (e.g., 'ETHUSDT').
@@ -58,60 +172,112 @@ class PrecisionFormatter:
         Returns:
             Formatted price aligned with tick size.
         """
-        tick_size = self._get_price_tick_size(symbol)
-        if not tick_size:
-            return price
+        return self._get_symbol_rules(symbol).align_price_decimal(price)
+
+    def _format_cached(self, symbol: str, value: float, is_price: bool) -> float:
+        """Align value with symbol's rules, reusing the result of an earlier identical call."""
+        # Looked up first so expired filters are refreshed; results from replaced rules are then misses
+        rules = self._get_symbol_rules(symbol)
+        key = (symbol, is_price, value)
+        cached = self._format_cache.get(key)
+        if cached is not None and cached[0] is rules:
+            self._format_cache.move_to_end(key)
+            return cached[1]
+
+        result = rules.align_price(value) if is_price else rules.align_quantity(value)
+        self._format_cache[key] = (rules, result)
+        self._format_cache.move_to_end(key)
+        if len(self._format_cache) > FORMAT_CACHE_SIZE:
+            self._format_cache.popitem(last=False)
+        return result
+
+    def _get_symbol_info(self, symbol: str) -> Mapping[str, Any]:
+        """Get symbol filters keyed by filterType, cached for the symbol-info TTL.
+
+        Every symbol in the response is indexed, so later lookups for those symbols are a dict hit.
+        The cached filters are shared, so they are returned as a read-only view rather than a copy.
+        """
+        now = time.monotonic()
+        cached = self._symbol_cache.get(symbol)
+        if cached and now < cached[0]:
+            return cached[1]
+        if cached:
+            # The client caches exchange info for longer than our TTL, so drop its copy to really refetch
+            self._client.clear_exchange_info_cache(symbol)
+
+        expires = now + self._symbol_info_ttl
+        try:
+            self._index_exchange_info(self._client.get_exchange_info(symbol), expires)
+        except (APIError, KeyError, TypeError, ValueError) as e:
+            # API failures and malformed payloads fall back to unformatted values; anything else is a bug
+            logger.error(f"Failed to get symbol info for {symbol}: {e}")
+
+        cached = self._symbol_cache.get(symbol)
+        if cached is None or cached[0] < expires:
+            # Missing from the response, or the request failed
+            self._store_symbol_filters(symbol, expires, {})
+        return self._symbol_cache[symbol][1]
+
+    def preload(self, symbols: Iterable[str] | None = None) -> None:
+        """Fetch filters for many symbols with a single exchange info request.
+
+        Args:
+            symbols: Symbols that must be cached afterwards; those missing from the response are cached
+                without filters unless they already have unexpired filters. When None, only the symbols
+                in the response are cached. A failed request leaves the cache as it was.
+        """
+        now = time.monotonic()
+        expires = now + self._symbol_info_ttl
+        try:
+            symbols_list = self._index_exchange_info(self._client.get_exchange_info(), expires)
+        except (APIError, KeyError, TypeError, ValueError) as e:
+            logger.error(f"Failed to preload symbol info: {e}")
+            return
+
+        indexed = {entry.get("symbol") for entry in symbols_list}
+        for symbol in symbols or ():
+            cached = self._symbol_cache.get(symbol)
+            if symbol not in indexed and (cached is None or now >= cached[0]):
+                self._store_symbol_filters(symbol, expires, {})
+
+    def _index_exchange_info(self, exchange_info: ExchangeInfo | None, expires: float) -> list[SymbolInfo]:
+        """Cache the filters of every symbol in an exchange info response and return its symbol entries."""
+        symbols_list = exchange_info.get("symbols", []) if exchange_info else []
+        for entry in symbols_list:
+            if entry.get("symbol"):
+                self._store_symbol_filters(entry["symbol"], expires, {f["filterType"]: f for f in entry.get("filters", [])})
+        return symbols_list
+
+    def _store_symbol_filters(self, symbol: str, expires: float, filters: dict[str, Any]) -> None:
+        """Cache filters for symbol and drop the rules parsed from the previous ones.
+
+        Formatted results are kept; they are tied to the rules they came from, so new rules turn them into misses.
+        """
+        self._symbol_cache[symbol] = (expires, MappingProxyType(filters))
+        self._rules_cache.pop(symbol, None)
 
-        # Use Decimal for precision
-        price_decimal = Decimal(str(price))
-        tick_decimal = Decimal(str(tick_size))
-
-        # Round to nearest tick: round(price / tickSize) * tickSize
-        ticks = (price_decimal / tick_decimal).quantize(Decimal("1"))
-        aligned_price = ticks * tick_decimal
-
-        return float(aligned_price)
-
-    def _get_symbol_info(self, symbol: str) -> dict[str, Any]:
-        """Get cached symbol information."""
-        if symbol not in self._symbol_cache:
-            try:
-                exchange_info = self._client.get_exchange_info(symbol)
-                if exchange_info and "symbols" in exchange_info:
-                    symbol_data = exchange_info["symbols"][0]
-                    filters = {f["filterType"]: f for f in symbol_data.get("filters", [])}
-                    self._symbol_cache[symbol] = filters
-                else:
-                    self._symbol_cache[symbol] = {}
-            except Exception as e:
-                logger.error(f"Failed to get symbol info for {symbol}: {e}")
-                self._symbol_cache[symbol] = {}
-
-        return self._symbol_cache[symbol]
+    def _get_symbol_rules(self, symbol: str) -> SymbolRules:
+        """Get the parsed step, minimum and tick sizes for symbol."""
+        # Refreshes expired filters first, which also drops the rules parsed from them
+        filters = self._get_symbol_info(symbol)
+        rules = self._rules_cache.get(symbol)
+        if rules is None:
+            rules = self._rules_cache[symbol] = SymbolRules.from_filters(filters)
+        return rules
 
     def _get_lot_size_step(self, symbol: str) -> float | None:
         """Get LOT_SIZE step size for symbol."""
-        filters = self._get_symbol_info(symbol)
-        lot_filter = filters.get("LOT_SIZE")
-        if lot_filter and "stepSize" in lot_filter:
-            return float(lot_filter["stepSize"])
-        return None
+        step = self._get_symbol_rules(symbol).step
+        return None if step is None else float(step)
 
     def _get_lot_size_min(self, symbol: str) -> float:
         """Get LOT_SIZE minimum quantity for symbol."""
-        filters = self._get_symbol_info(symbol)
-        lot_filter = filters.get("LOT_SIZE")
-        if lot_filter and "minQty" in lot_filter:
-            return float(lot_filter["minQty"])
-        return 0.0
+        return float(self._get_symbol_rules(symbol).min_qty)
 
     def _get_price_tick_size(self, symbol: str) -> float | None:
         """Get PRICE_FILTER tick size for symbol."""
-        filters = self._get_symbol_info(symbol)
-        price_filter = filters.get("PRICE_FILTER")
-        if price_filter and "tickSize" in price_filter:
-            return float(price_filter["tickSize"])
-        return None
+        tick = self._get_symbol_rules(symbol).tick
+        return None if tick is None else float(tick)
 
     def format_oco_params(self, symbol: str, quantity: float, limit_price: float, stop_price: float) -> tuple[float, float, float]:
         """Format all OCO order parameters for precision.
@@ -125,9 +291,11 @@ class PrecisionFormatter:
         Returns:
             Tuple of (formatted_quantity, formatted_limit_price, formatted_stop_price).
         """
-        formatted_qty = self.format_quantity(symbol, quantity)
-        formatted_limit = self.format_price(symbol, limit_price)
-        formatted_stop = self.format_price(symbol, stop_price)
+        # One rules lookup for all three values
+        rules = self._get_symbol_rules(symbol)
+        formatted_qty = rules.align_quantity(quantity)
+        formatted_limit = rules.align_price(limit_price)
+        formatted_stop = rules.align_price(stop_price)
 
         logger.info(f"OCO formatting for {symbol}:")
         logger.info(f"  Quantity: {quantity} → {formatted_qty}")
@@ -147,8 +315,9 @@ class PrecisionFormatter:
         Returns:
             Tuple of (formatted_quantity, formatted_price).
         """
-        formatted_qty = self.format_quantity(symbol, quantity)
-        formatted_price = self.format_price(symbol, price)
+        rules = self._get_symbol_rules(symbol)
+        formatted_qty = rules.align_quantity(quantity)
+        formatted_price = rules.align_price(price)
 
         logger.info(f"Limit order formatting for {symbol}:")
         logger.info(f"  Quantity: {quantity} → {formatted_qty}")
@@ -103,6 +103,24 @@ def test_get_exchange_info_caching(mock_env: Any) -> None:
         assert mock_request.call_count == 2  # Should be called again
 
 
+def test_clear_exchange_info_cache(mock_env: Any) -> None:
+    """Test that clearing the exchange info cache forces a refetch before the TTL expires."""
+    with patch.object(BinanceClient, "_request") as mock_request:
+        mock_request.return_value = {"timezone": "UTC", "symbols": []}
+        client = BinanceClient()
+
+        client.get_exchange_info("BTCUSDT")
+        client.get_exchange_info("ETHUSDT")
+        client.clear_exchange_info_cache("btcusdt")
+        client.get_exchange_info("BTCUSDT")
+        client.get_exchange_info("ETHUSDT")
+        assert mock_request.call_count == 3  # Only BTCUSDT was refetched
+
+        client.clear_exchange_info_cache()
+        client.get_exchange_info("ETHUSDT")
+        assert mock_request.call_count == 4
+
+
 @patch("requests.Session")
 def test_get_klines(mock_session: MagicMock, mock_env: Any) -> None:
     """Test getting kline data."""
@@ -3,10 +3,12 @@ import os
 import sys
 from collections.abc import Callable
 from typing import Any
+from unittest.mock import MagicMock
 
 import pytest
 from _pytest.monkeypatch import MonkeyPatch
 from hypothesis import Phase, Verbosity, settings
+from hypothesis.database import DirectoryBasedExampleDatabase
 from typer import Typer
 
 from src.api.exceptions import APIError
@@ -26,13 +28,24 @@ settings.register_profile(
     "fast",
     max_examples=10,  # Reduced from default 100
     deadline=1000,  # 1 second deadline per test
-    phases=[Phase.generate],  # Skip shrinking phase to prevent timeouts
+    phases=[Phase.explicit, Phase.reuse, Phase.generate],  # Replay saved failures first; skip shrinking to prevent timeouts
+    database=DirectoryBasedExampleDatabase(os.path.join(project_root, ".hypothesis", "examples")),
     verbosity=Verbosity.normal,
     suppress_health_check=[],
 )
 settings.load_profile("fast")
 
 
+class StubBinanceClient:
+    """BinanceClient stand-in exposing the endpoints the validator and formatter call, each as a MagicMock."""
+
+    def __init__(self) -> None:
+        self.get_exchange_info = MagicMock()
+        self.get_all_tickers = MagicMock()
+        self.get_price = MagicMock()
+        self.clear_exchange_info_cache = MagicMock()
+
+
 @pytest.fixture(autouse=True)
 def mock_env(monkeypatch: MonkeyPatch) -> None:
     """Mocks environment variables for tests - UPDATED with Perplexity key."""
@@ -6,9 +6,11 @@ difficult to catch with traditional example-based unit tests.
 """
 
 import math
+from typing import Any
 from unittest.mock import Mock, patch
 
 import pandas as pd
+import pytest
 from hypothesis import HealthCheck, assume, given, settings
 from hypothesis import strategies as st
 
@@ -17,6 +19,28 @@ from src.core.indicators import IndicatorService
 from src.core.order_validator import OrderValidator
 from src.core.perplexity_service import PerplexityService
 
+# The OCO property only varies prices, so every example shares this exchange payload
+_BTCUSDT_EXCHANGE_INFO: dict[str, Any] = {
+    "symbols": [
+        {
+            "symbol": "BTCUSDT",
+            "filters": [
+                {"filterType": "LOT_SIZE", "minQty": "0.001", "maxQty": "1000", "stepSize": "0.001"},
+                {"filterType": "PRICE_FILTER", "minPrice": "0.01", "maxPrice": "1000000", "tickSize": "0.01"},
+                {"filterType": "NOTIONAL", "minNotional": "10.0", "maxNotional": "100000"},
+            ],
+        }
+    ]
+}
+
+
+@pytest.fixture(scope="module")
+def order_validator() -> OrderValidator:
+    """Create one OrderValidator for the module; Hypothesis examples cannot use function-scoped fixtures."""
+    mock_client = Mock(spec=BinanceClient)
+    mock_client.get_exchange_info.return_value = _BTCUSDT_EXCHANGE_INFO
+    return OrderValidator(mock_client)
+
 
 class TestRSIProperties:
     """Property-based tests for RSI calculation properties."""
@@ -227,28 +251,13 @@ class TestOrderValidationProperties:
         st.floats(min_value=900, max_value=49000, allow_nan=False, allow_infinity=False),  # Stop price
     )
     @settings(max_examples=3, deadline=100, suppress_health_check=[HealthCheck.filter_too_much])
-    def test_oco_order_price_relationship_properties(self, quantity: float, price: float, stop_price: float) -> None:
+    def test_oco_order_price_relationship_properties(self, order_validator: OrderValidator, quantity: float, price: float, stop_price: float) -> None:
         """Property: OCO order prices should maintain logical relationships."""
         assume(stop_price < price)  # Stop price should be below limit price for sell OCO
         assume(price - stop_price > 1)  # Ensure meaningful price difference
 
-        # Create validator inline to avoid fixture issues
-        mock_client = Mock(spec=BinanceClient)
-        order_validator = OrderValidator(mock_client)
-
-        # Mock the required methods to return valid data
-        order_validator._client.get_exchange_info.return_value = {
-            "symbols": [
-                {
-                    "symbol": "BTCUSDT",
-                    "filters": [
-                        {"filterType": "LOT_SIZE", "minQty": "0.001", "maxQty": "1000", "stepSize": "0.001"},
-                        {"filterType": "PRICE_FILTER", "minPrice": "0.01", "maxPrice": "1000000", "tickSize": "0.01"},
-                        {"filterType": "NOTIONAL", "minNotional": "10.0", "maxNotional": "100000"},
-                    ],
-                }
-            ]
-        }
+        # Each example sets its own current price, so drop the previous example's cached ticker
+        order_validator.invalidate_cache()
         order_validator._client.get_all_tickers.return_value = [{"symbol": "BTCUSDT", "price": str((price + stop_price) / 2)}]
 
         is_valid, errors = order_validator.validate_oco_order("BTCUSDT", quantity, price, stop_price)
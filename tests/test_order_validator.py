@@ -5,64 +5,83 @@ Tests core order validation business logic, exchange constraints,
 and critical safety features without redundant property-based testing.
 """
 
+import copy
+import pickle
+from collections.abc import Callable, Iterator
+from decimal import Decimal
 from typing import Any
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
 from src.api.client import BinanceClient
 from src.api.enums import OrderSide, OrderType
-from src.core.order_validator import OrderValidator
+from src.api.models import Ticker
+from src.core.order_validator import CodedValidationError, OrderSpec, OrderValidator, SymbolSpec, ValidationErrorCode
+from tests.conftest import StubBinanceClient
+
+# Built once per session; the validator only reads these payloads
+_SAMPLE_SYMBOL_INFO: dict[str, Any] = {
+    "symbols": [
+        {
+            "symbol": "ETHUSDT",
+            "filters": [
+                {"filterType": "LOT_SIZE", "minQty": "0.00010000", "maxQty": "9000.00000000", "stepSize": "0.00010000"},
+                {"filterType": "PRICE_FILTER", "minPrice": "0.01000000", "maxPrice": "1000000.00000000", "tickSize": "0.01000000"},
+                {
+                    "filterType": "PERCENT_PRICE_BY_SIDE",
+                    "bidMultiplierUp": "5",
+                    "bidMultiplierDown": "0.2",
+                    "askMultiplierUp": "5",
+                    "askMultiplierDown": "0.2",
+                },
+                {"filterType": "NOTIONAL", "minNotional": "10.00000000", "maxNotional": "9000000.00000000"},
+            ],
+        }
+    ]
+}
+_SAMPLE_TICKERS: list[Ticker] = [{"symbol": "ETHUSDT", "price": "2500.00"}, {"symbol": "BTCUSDT", "price": "100000.00"}]
+
+# Single-filter specs for the constraint tests; SymbolSpec is frozen, so every case can share one
+_LOT_SPEC = SymbolSpec.from_filters({"LOT_SIZE": {"minQty": "0.001", "maxQty": "1000.0", "stepSize": "0.001"}})
+_PRICE_SPEC = SymbolSpec.from_filters({"PRICE_FILTER": {"minPrice": "10.0", "maxPrice": "100000.0", "tickSize": "0.01"}})
+_NOTIONAL_SPEC = SymbolSpec.from_filters({"NOTIONAL": {"minNotional": "10.0", "maxNotional": "100000.0"}})
+_PERCENT_SPEC = SymbolSpec.from_filters(
+    {"PERCENT_PRICE_BY_SIDE": {"bidMultiplierUp": "1.2", "bidMultiplierDown": "0.2", "askMultiplierUp": "5", "askMultiplierDown": "0.8"}}
+)
 
 
 class TestOrderValidator:
     """Test cases for OrderValidator core functionality."""
 
     @pytest.fixture
-    def mock_client(self) -> Mock:
-        """Create a mock BinanceClient for testing."""
-        return Mock(spec=BinanceClient)
+    def mock_client(self) -> StubBinanceClient:
+        """Create a stub client serving the sample market data; tests override only what they need."""
+        client = StubBinanceClient()
+        client.get_exchange_info.return_value = _SAMPLE_SYMBOL_INFO
+        client.get_all_tickers.return_value = _SAMPLE_TICKERS
+        return client
 
     @pytest.fixture
-    def validator(self, mock_client: Mock) -> OrderValidator:
-        """Create an OrderValidator instance with mock client."""
+    def validator(self, mock_client: StubBinanceClient) -> OrderValidator:
+        """Create an OrderValidator instance with the stub client."""
         return OrderValidator(mock_client)
 
     @pytest.fixture
-    def sample_symbol_info(self) -> dict[str, Any]:
-        """Sample symbol info data for testing."""
-        return {
-            "symbols": [
-                {
-                    "symbol": "ETHUSDT",
-                    "filters": [
-                        {"filterType": "LOT_SIZE", "minQty": "0.00010000", "maxQty": "9000.00000000", "stepSize": "0.00010000"},
-                        {"filterType": "PRICE_FILTER", "minPrice": "0.01000000", "maxPrice": "1000000.00000000", "tickSize": "0.01000000"},
-                        {
-                            "filterType": "PERCENT_PRICE_BY_SIDE",
-                            "bidMultiplierUp": "5",
-                            "bidMultiplierDown": "0.2",
-                            "askMultiplierUp": "5",
-                            "askMultiplierDown": "0.2",
-                        },
-                        {"filterType": "NOTIONAL", "minNotional": "10.00000000", "maxNotional": "9000000.00000000"},
-                    ],
-                }
-            ]
-        }
+    def http_session(self) -> Iterator[MagicMock]:
+        """Patch the HTTP session so a real BinanceClient, with its own exchange-info cache, serves the sample data."""
+        with patch("requests.Session") as mock_session:
+            mock_session.return_value.request.return_value.json.return_value = _SAMPLE_SYMBOL_INFO
+            yield mock_session.return_value
 
     @pytest.fixture
-    def sample_tickers(self) -> list[dict[str, str]]:
-        """Sample ticker data for testing."""
-        return [{"symbol": "ETHUSDT", "price": "2500.00"}, {"symbol": "BTCUSDT", "price": "100000.00"}]
+    def patched_account(self) -> Iterator[Mock]:
+        """Patch AccountService so balance checks use a mock service."""
+        with patch("core.account.AccountService") as mock_account:
+            yield mock_account
 
-    def test_validate_order_placement_oco_success(
-        self, validator: OrderValidator, mock_client: Mock, sample_symbol_info: dict[str, Any], sample_tickers: list[dict[str, str]]
-    ) -> None:
+    def test_validate_order_placement_oco_success(self, validator: OrderValidator) -> None:
         """Test successful OCO order validation through main entry point."""
-        mock_client.get_exchange_info.return_value = sample_symbol_info
-        mock_client.get_all_tickers.return_value = sample_tickers
-
         with patch.object(validator, "_validate_available_balance", return_value=(True, [])):
             is_valid, errors = validator.validate_order_placement(
                 symbol="ETHUSDT",
@@ -76,7 +95,18 @@ class TestOrderValidator:
         assert is_valid is True
         assert len(errors) == 0
 
-    def test_validate_order_placement_oco_missing_prices(self, validator: OrderValidator, mock_client: Mock) -> None:
+    def test_validate_order_placement_oco_single_price_lookup(self, validator: OrderValidator) -> None:
+        """Test the current price fetched for placement is reused by the OCO checks."""
+        with (
+            patch.object(validator, "_validate_available_balance", return_value=(True, [])),
+            patch.object(validator, "_get_current_price", wraps=validator._get_current_price) as price_lookup,
+        ):
+            is_valid, _ = validator.validate_order_placement("ETHUSDT", OrderSide.SELL, OrderType.OCO, 0.5, price=2600.00, stop_price=2400.00)
+
+        assert is_valid is True
+        price_lookup.assert_called_once_with("ETHUSDT")
+
+    def test_validate_order_placement_oco_missing_prices(self, validator: OrderValidator, mock_client: StubBinanceClient) -> None:
         """Test OCO order validation with missing required prices."""
         mock_client.get_all_tickers.return_value = [{"symbol": "ETHUSDT", "price": "2500.00"}]
 
@@ -93,13 +123,8 @@ class TestOrderValidator:
         assert is_valid is False
         assert any("Price and stop_price are required for OCO orders" in error for error in errors)
 
-    def test_validate_order_placement_limit_success(
-        self, validator: OrderValidator, mock_client: Mock, sample_symbol_info: dict[str, Any], sample_tickers: list[dict[str, str]]
-    ) -> None:
+    def test_validate_order_placement_limit_success(self, validator: OrderValidator) -> None:
         """Test successful limit order validation."""
-        mock_client.get_exchange_info.return_value = sample_symbol_info
-        mock_client.get_all_tickers.return_value = sample_tickers
-
         with patch.object(validator, "_validate_available_balance", return_value=(True, [])):
             is_valid, errors = validator.validate_order_placement(
                 symbol="ETHUSDT",
@@ -112,7 +137,7 @@ class TestOrderValidator:
         assert is_valid is True
         assert len(errors) == 0
 
-    def test_validate_order_placement_immediate_fill_detection(self, validator: OrderValidator, mock_client: Mock) -> None:
+    def test_validate_order_placement_immediate_fill_detection(self, validator: OrderValidator, mock_client: StubBinanceClient) -> None:
         """Test immediate fill risk detection (CRITICAL safety feature)."""
         mock_client.get_all_tickers.return_value = [{"symbol": "ETHUSDT", "price": "2500.00"}]
 
@@ -126,7 +151,8 @@ class TestOrderValidator:
         )
 
         assert is_valid is False
-        assert any("CRITICAL: BUY LIMIT" in error and "would fill IMMEDIATELY" in error for error in errors)
+        assert [error.code for error in errors] == [ValidationErrorCode.IMMEDIATE_BUY_LIMIT]
+        assert errors == ["🚨 CRITICAL: BUY LIMIT at $2,600.00 would fill IMMEDIATELY (current price: $2,500.00). For accumulation, use price < $2,500.00"]
 
         # SELL LIMIT below current price (would fill immediately)
         is_valid, errors = validator.validate_order_placement(
@@ -138,51 +164,85 @@ class TestOrderValidator:
         )
 
         assert is_valid is False
-        assert any("CRITICAL: SELL LIMIT" in error and "would fill IMMEDIATELY" in error for error in errors)
+        assert [error.code for error in errors] == [ValidationErrorCode.IMMEDIATE_SELL_LIMIT]
+
+        # Rejected before any exchange-info lookup
+        mock_client.get_exchange_info.assert_not_called()
+
+    def test_validate_order_placement_oco_immediate_fill_detection(self, validator: OrderValidator, mock_client: StubBinanceClient) -> None:
+        """Test OCO legs on the wrong side of the market return only the CRITICAL errors."""
+        is_valid, errors = validator.validate_order_placement("ETHUSDT", OrderSide.SELL, OrderType.OCO, 0.5, price=2400.00, stop_price=2600.00)
+
+        assert is_valid is False
+        assert [error.code for error in errors] == [ValidationErrorCode.IMMEDIATE_OCO_LIMIT, ValidationErrorCode.IMMEDIATE_OCO_STOP]
 
-    def test_available_balance_uses_exchange_assets_buy_ethbtc(self, validator: OrderValidator, mock_client: Mock) -> None:
+        # Rejected before any exchange-info or balance lookup
+        mock_client.get_exchange_info.assert_not_called()
+
+    def test_available_balance_uses_exchange_assets_buy_ethbtc(self, validator: OrderValidator, mock_client: StubBinanceClient, patched_account: Mock) -> None:
         """BUY ETHBTC should check quote BTC, not USDT."""
-        mock_client.get_all_tickers.return_value = [{"symbol": "ETHBTC", "price": "0.050000"}]
+        mock_client.get_all_tickers.return_value = [{"symbol": "ETHBTC", "price": "0.150000"}]
         mock_client.get_exchange_info.return_value = {"symbols": [{"symbol": "ETHBTC", "baseAsset": "ETH", "quoteAsset": "BTC", "filters": []}]}
+        # Suppose available BTC is insufficient
+        patched_account.return_value.get_effective_available_balance.return_value = (0.001, {"buy_orders": 0.0})
 
-        with patch("core.account.AccountService") as MockAcct:
-            service = MockAcct.return_value
-            # Suppose available BTC is insufficient
-            service.get_effective_available_balance.return_value = (0.001, {"buy_orders": 0.0})
-
-            is_valid, errors = validator.validate_order_placement(
-                symbol="ETHBTC",
-                side=OrderSide.BUY,
-                order_type=OrderType.LIMIT,
-                quantity=1.0,
-                price=0.1,  # requires 0.1 BTC
-            )
+        is_valid, errors = validator.validate_order_placement(
+            symbol="ETHBTC",
+            side=OrderSide.BUY,
+            order_type=OrderType.LIMIT,
+            quantity=1.0,
+            price=0.1,  # requires 0.1 BTC
+        )
 
-            assert is_valid is False
-            assert any("Insufficient effective BTC balance" in e for e in errors)
+        assert is_valid is False
+        assert any("Insufficient effective BTC balance" in e for e in errors)
 
-    def test_available_balance_uses_exchange_assets_sell_ethbtc(self, validator: OrderValidator, mock_client: Mock) -> None:
+    def test_available_balance_uses_exchange_assets_sell_ethbtc(self, validator: OrderValidator, mock_client: StubBinanceClient, patched_account: Mock) -> None:
         """SELL ETHBTC should check base ETH balance."""
         mock_client.get_all_tickers.return_value = [{"symbol": "ETHBTC", "price": "0.050000"}]
         mock_client.get_exchange_info.return_value = {"symbols": [{"symbol": "ETHBTC", "baseAsset": "ETH", "quoteAsset": "BTC", "filters": []}]}
+        # Suppose available ETH is insufficient
+        patched_account.return_value.get_effective_available_balance.return_value = (0.2, {"sell_orders": 0.0, "oco_orders": 0.0})
+
+        is_valid, errors = validator.validate_order_placement(
+            symbol="ETHBTC",
+            side=OrderSide.SELL,
+            order_type=OrderType.LIMIT,
+            quantity=0.5,
+            price=0.1,
+        )
 
-        with patch("core.account.AccountService") as MockAcct:
-            service = MockAcct.return_value
-            # Suppose available ETH is insufficient
-            service.get_effective_available_balance.return_value = (0.2, {"sell_orders": 0.0, "oco_orders": 0.0})
+        assert is_valid is False
+        assert any("Insufficient effective ETH balance" in e for e in errors)
 
-            is_valid, errors = validator.validate_order_placement(
-                symbol="ETHBTC",
-                side=OrderSide.SELL,
-                order_type=OrderType.LIMIT,
-                quantity=0.5,
-                price=0.1,
-            )
+    def test_validate_order_placement_market_success(self, validator: OrderValidator, patched_account: Mock) -> None:
+        """Test a MARKET order runs the market handler and the balance check."""
+        patched_account.return_value.get_effective_available_balance.return_value = (1.0, {"sell_orders": 0.0, "oco_orders": 0.0})
+
+        is_valid, errors = validator.validate_order_placement("ETHUSDT", OrderSide.SELL, OrderType.MARKET, 0.5)
+
+        assert is_valid is True
+        assert errors == []
+        patched_account.return_value.get_effective_available_balance.assert_called_once_with("ETH")
+
+    def test_validate_order_placement_market_insufficient_balance(self, validator: OrderValidator, patched_account: Mock) -> None:
+        """Test balance errors from the shared balance check are reported by validate_order_placement."""
+        patched_account.return_value.get_effective_available_balance.return_value = (0.2, {"sell_orders": 0.0, "oco_orders": 0.0})
+
+        is_valid, errors = validator.validate_order_placement("ETHUSDT", OrderSide.SELL, OrderType.MARKET, 0.5)
+
+        assert is_valid is False
+        assert len(errors) == 1
+        assert "Insufficient effective ETH balance" in errors[0]
 
-            assert is_valid is False
-            assert any("Insufficient effective ETH balance" in e for e in errors)
+    def test_validate_order_placement_batch_limit_missing_price(self, validator: OrderValidator, patched_account: Mock) -> None:
+        """Test a LIMIT order without a price is rejected before the balance check."""
+        results = validator.validate_order_placement_batch([OrderSpec("ETHUSDT", OrderSide.BUY, OrderType.LIMIT, 0.5, None)])
 
-    def test_validate_order_placement_no_current_price(self, validator: OrderValidator, mock_client: Mock) -> None:
+        assert results == [(False, ["Price is required for LIMIT orders"])]
+        patched_account.return_value.get_effective_available_balance.assert_not_called()
+
+    def test_validate_order_placement_no_current_price(self, validator: OrderValidator, mock_client: StubBinanceClient) -> None:
         """Test validation when current price cannot be retrieved."""
         mock_client.get_all_tickers.return_value = []
 
@@ -197,7 +257,7 @@ class TestOrderValidator:
         assert is_valid is False
         assert any("Could not retrieve current price for ETHUSDT" in error for error in errors)
 
-    def test_validate_order_placement_api_exception(self, validator: OrderValidator, mock_client: Mock) -> None:
+    def test_validate_order_placement_api_exception(self, validator: OrderValidator, mock_client: StubBinanceClient) -> None:
         """Test validation when API calls fail."""
         mock_client.get_all_tickers.side_effect = Exception("API Error")
 
@@ -212,13 +272,8 @@ class TestOrderValidator:
         assert is_valid is False
         assert any("Could not retrieve current price" in error for error in errors)
 
-    def test_validate_oco_order_success(
-        self, validator: OrderValidator, mock_client: Mock, sample_symbol_info: dict[str, Any], sample_tickers: list[dict[str, str]]
-    ) -> None:
+    def test_validate_oco_order_success(self, validator: OrderValidator) -> None:
         """Test successful OCO order validation."""
-        mock_client.get_exchange_info.return_value = sample_symbol_info
-        mock_client.get_all_tickers.return_value = sample_tickers
-
         is_valid, errors = validator.validate_oco_order(
             symbol="ETHUSDT",
             quantity=0.5000,  # Aligned with step size
@@ -229,13 +284,8 @@ class TestOrderValidator:
         assert is_valid is True
         assert len(errors) == 0
 
-    def test_validate_oco_order_invalid_price_logic(
-        self, validator: OrderValidator, mock_client: Mock, sample_symbol_info: dict[str, Any], sample_tickers: list[dict[str, str]]
-    ) -> None:
+    def test_validate_oco_order_invalid_price_logic(self, validator: OrderValidator) -> None:
         """Test OCO order validation with invalid price logic."""
-        mock_client.get_exchange_info.return_value = sample_symbol_info
-        mock_client.get_all_tickers.return_value = sample_tickers
-
         # Invalid price logic - limit below current, stop above current
         is_valid, errors = validator.validate_oco_order(
             symbol="ETHUSDT",
@@ -249,7 +299,7 @@ class TestOrderValidator:
         assert any("must be ABOVE current price" in error for error in errors)
         assert any("must be BELOW current price" in error for error in errors)
 
-    def test_validate_oco_order_no_symbol_info(self, validator: OrderValidator, mock_client: Mock) -> None:
+    def test_validate_oco_order_no_symbol_info(self, validator: OrderValidator, mock_client: StubBinanceClient) -> None:
         """Test OCO validation when symbol information is unavailable."""
         mock_client.get_exchange_info.return_value = None
         mock_client.get_all_tickers.return_value = []
@@ -259,13 +309,8 @@ class TestOrderValidator:
         assert not is_valid
         assert any("Could not retrieve symbol information" in error for error in errors)
 
-    def test_validate_limit_order_success(
-        self, validator: OrderValidator, mock_client: Mock, sample_symbol_info: dict[str, Any], sample_tickers: list[dict[str, str]]
-    ) -> None:
+    def test_validate_limit_order_success(self, validator: OrderValidator) -> None:
         """Test successful limit order validation."""
-        mock_client.get_exchange_info.return_value = sample_symbol_info
-        mock_client.get_all_tickers.return_value = sample_tickers
-
         is_valid, errors = validator.validate_limit_order(
             symbol="ETHUSDT",
             side=OrderSide.BUY,
@@ -276,182 +321,319 @@ class TestOrderValidator:
         assert is_valid is True
         assert len(errors) == 0
 
-    def test_validate_market_order_constraints_success(
-        self, validator: OrderValidator, mock_client: Mock, sample_symbol_info: dict[str, Any], sample_tickers: list[dict[str, str]]
-    ) -> None:
-        """Test successful market order validation."""
-        mock_client.get_exchange_info.return_value = sample_symbol_info
-        mock_client.get_all_tickers.return_value = sample_tickers
+    def test_validate_limit_order_decimal_inputs(self, validator: OrderValidator) -> None:
+        """Test Decimal quantities and prices, as returned by the precision formatter, validate like floats."""
+        is_valid, errors = validator.validate_limit_order("ETHUSDT", OrderSide.BUY, Decimal("0.5000"), Decimal("2400.00"))  # type: ignore[arg-type]
+        assert (is_valid, errors) == (True, [])
 
-        is_valid, errors = validator._validate_market_order_constraints("ETHUSDT", 0.5000)
+        is_valid, errors = validator.validate_limit_order("ETHUSDT", OrderSide.BUY, Decimal("0.50005"), Decimal("2400.005"))  # type: ignore[arg-type]
+        assert [error.code for error in errors] == [ValidationErrorCode.LOT_STEP, ValidationErrorCode.PRICE_TICK]
 
-        assert is_valid is True
-        assert len(errors) == 0
-
-    def test_validate_market_order_constraints_invalid_quantity(
-        self, validator: OrderValidator, mock_client: Mock, sample_symbol_info: dict[str, Any], sample_tickers: list[dict[str, str]]
-    ) -> None:
-        """Test market order validation with invalid quantity."""
-        mock_client.get_exchange_info.return_value = sample_symbol_info
-        mock_client.get_all_tickers.return_value = sample_tickers
-
-        is_valid, errors = validator._validate_market_order_constraints("ETHUSDT", 0.00005)  # Below minimum
+    def test_symbol_spec_parsed_once_per_symbol(self, validator: OrderValidator, mock_client: StubBinanceClient) -> None:
+        """Test that exchange filters are parsed once and reused for later validations."""
+        validator.validate_limit_order("ETHUSDT", OrderSide.BUY, 0.5, 2400.0)
+        is_valid, errors = validator.validate_limit_order("ETHUSDT", OrderSide.BUY, 0.00005, 2400.0)
 
+        assert mock_client.get_exchange_info.call_count == 1
         assert is_valid is False
-        assert len(errors) >= 1
-        assert any("below minimum" in error for error in errors)
+        assert ValidationErrorCode.LOT_MIN in {error.code for error in errors}
 
+    def test_exchange_info_shared_and_invalidated(
+        self,
+        validator: OrderValidator,
+        mock_client: StubBinanceClient,
+        patched_account: Mock,
+    ) -> None:
+        """Test that filter and asset lookups share one exchange-info fetch until invalidated."""
+        patched_account.return_value.get_effective_available_balance.return_value = (10000.0, {})
 
-class TestExchangeConstraints:
-    """Test exchange constraint validation methods."""
+        validator.validate_order_placement("ETHUSDT", OrderSide.BUY, OrderType.LIMIT, 0.5, 2400.0)
+        assert mock_client.get_exchange_info.call_count == 1
 
-    @pytest.fixture
-    def validator(self) -> OrderValidator:
-        """Create OrderValidator with mock client."""
-        return OrderValidator(Mock(spec=BinanceClient))
+        validator.invalidate_cache()
+        validator.validate_order_placement("ETHUSDT", OrderSide.BUY, OrderType.LIMIT, 0.5, 2400.0)
+        assert mock_client.get_exchange_info.call_count == 2
 
-    def test_validate_lot_size_below_minimum(self, validator: OrderValidator) -> None:
-        """Test LOT_SIZE validation below minimum."""
-        lot_filter = {"minQty": "0.001", "maxQty": "1000.0", "stepSize": "0.001"}
+    def test_invalidate_cache_clears_client_exchange_info(self, http_session: MagicMock) -> None:
+        """Test invalidation reaches the API even though the client caches exchange info itself."""
+        validator = OrderValidator(BinanceClient())
 
-        errors = validator._validate_lot_size(0.0005, lot_filter)
-        assert len(errors) >= 1
-        assert any("below minimum" in error for error in errors)
+        validator._get_symbol_info("ETHUSDT")
+        validator._get_symbol_info("ETHUSDT")
+        assert http_session.request.call_count == 1
 
-    def test_validate_lot_size_above_maximum(self, validator: OrderValidator) -> None:
-        """Test LOT_SIZE validation above maximum."""
-        lot_filter = {"minQty": "0.001", "maxQty": "1000.0", "stepSize": "0.001"}
+        validator.invalidate_cache()
+        validator._get_symbol_info("ETHUSDT")
+        assert http_session.request.call_count == 2
 
-        errors = validator._validate_lot_size(1500.0, lot_filter)
-        assert len(errors) == 1
-        assert "above maximum" in errors[0]
-
-    def test_validate_lot_size_step_alignment(self, validator: OrderValidator) -> None:
-        """Test LOT_SIZE step size alignment."""
-        lot_filter = {"minQty": "0.0", "maxQty": "1000.0", "stepSize": "0.001"}
+    def test_expired_exchange_info_refetched_past_client_cache(self, http_session: MagicMock) -> None:
+        """Test an expired exchange-info entry is refetched from the API, not served from the client cache."""
+        validator = OrderValidator(BinanceClient(), exchange_info_ttl=0.0)
 
-        # This should fail alignment (0.0015 is not aligned with 0.001 step)
-        errors = validator._validate_lot_size(0.0015, lot_filter)
-        assert len(errors) == 1
-        assert "not aligned with step size" in errors[0]
+        validator._get_symbol_info("ETHUSDT")
+        validator._get_symbol_info("ETHUSDT")
+        assert http_session.request.call_count == 2
 
-    def test_validate_lot_size_success(self, validator: OrderValidator) -> None:
-        """Test successful LOT_SIZE validation."""
-        lot_filter = {"minQty": "0.001", "maxQty": "1000.0", "stepSize": "0.001"}
+    def test_validate_order_placement_batch(
+        self,
+        validator: OrderValidator,
+        patched_account: Mock,
+    ) -> None:
+        """Test batch validation fetches one balance per asset and reserves it across orders."""
+        service = patched_account.return_value
+        # Enough USDT for nine of the ten 1,200 USDT orders
+        service.get_effective_available_balance.return_value = (11000.0, {"buy_orders": 0.0})
 
-        errors = validator._validate_lot_size(0.5, lot_filter)  # Valid quantity
-        assert len(errors) == 0
+        orders = [OrderSpec("ETHUSDT", OrderSide.BUY, OrderType.LIMIT, 0.5, 2400.0) for _ in range(10)]
+        results = validator.validate_order_placement_batch(orders)
 
-    def test_validate_price_filter_below_minimum(self, validator: OrderValidator) -> None:
-        """Test PRICE_FILTER validation below minimum."""
-        price_filter = {"minPrice": "10.0", "maxPrice": "100000.0", "tickSize": "0.01"}
+        service.get_effective_available_balance.assert_called_once_with("USDT")
+        assert [is_valid for is_valid, _ in results] == [True] * 9 + [False]
+        assert any("Insufficient effective USDT balance" in e for e in results[-1][1])
 
-        errors = validator._validate_price_filter([5.0], price_filter)
-        assert len(errors) == 1
-        assert "below minimum" in errors[0]
+    def test_validate_order_placement_batch_balance_fetch_failure(self, validator: OrderValidator, patched_account: Mock) -> None:
+        """Test a failed balance fetch only fails the orders spending that asset."""
 
-    def test_validate_price_filter_above_maximum(self, validator: OrderValidator) -> None:
-        """Test PRICE_FILTER validation above maximum."""
-        price_filter = {"minPrice": "10.0", "maxPrice": "100000.0", "tickSize": "0.01"}
+        def balance(asset: str) -> tuple[float, dict[str, float]]:
+            if asset == "ETH":
+                raise RuntimeError("account unavailable")
+            return 10000.0, {"buy_orders": 0.0}
 
-        errors = validator._validate_price_filter([150000.0], price_filter)
-        assert len(errors) == 1
-        assert "above maximum" in errors[0]
+        patched_account.return_value.get_effective_available_balance.side_effect = balance
 
-    def test_validate_price_filter_tick_alignment(self, validator: OrderValidator) -> None:
-        """Test PRICE_FILTER tick size alignment."""
-        price_filter = {"minPrice": "0.0", "maxPrice": "100000.0", "tickSize": "0.01"}
+        orders = [
+            OrderSpec("ETHUSDT", OrderSide.BUY, OrderType.LIMIT, 0.5, 2400.0),
+            OrderSpec("ETHUSDT", OrderSide.SELL, OrderType.LIMIT, 0.5, 2600.0),
+        ]
+        results = validator.validate_order_placement_batch(orders)
 
-        errors = validator._validate_price_filter([100.005], price_filter)  # Not aligned with 0.01
-        assert len(errors) == 1
-        assert "not aligned with tick size" in errors[0]
+        assert results[0] == (True, [])
+        assert results[1] == (False, ["Balance validation error: account unavailable"])
 
-    def test_validate_price_filter_success(self, validator: OrderValidator) -> None:
-        """Test successful PRICE_FILTER validation."""
-        price_filter = {"minPrice": "10.0", "maxPrice": "100000.0", "tickSize": "0.01"}
+    def test_validate_order_placement_batch_mixed_sides_share_asset(
+        self, validator: OrderValidator, mock_client: StubBinanceClient, patched_account: Mock
+    ) -> None:
+        """Test BUY and SELL orders spending the same asset draw on one balance."""
+        exchange_info = {
+            "ETHBTC": {"symbols": [{"symbol": "ETHBTC", "baseAsset": "ETH", "quoteAsset": "BTC", "filters": []}]},
+            "BTCUSDT": {"symbols": [{"symbol": "BTCUSDT", "baseAsset": "BTC", "quoteAsset": "USDT", "filters": []}]},
+        }
+        mock_client.get_exchange_info.side_effect = lambda symbol=None: exchange_info[symbol]
+        mock_client.get_all_tickers.return_value = [{"symbol": "ETHBTC", "price": "0.060000"}, {"symbol": "BTCUSDT", "price": "100000.00"}]
+        service = patched_account.return_value
+        service.get_effective_available_balance.return_value = (1.0, {"buy_orders": 0.0, "sell_orders": 0.0, "oco_orders": 0.0})
+
+        orders = [
+            OrderSpec("ETHBTC", OrderSide.BUY, OrderType.LIMIT, 1.0, 0.05),  # spends 0.05 BTC
+            OrderSpec("BTCUSDT", OrderSide.SELL, OrderType.LIMIT, 0.99, 101000.0),  # spends 0.99 BTC
+        ]
+        results = validator.validate_order_placement_batch(orders)
+
+        service.get_effective_available_balance.assert_called_once_with("BTC")
+        assert [is_valid for is_valid, _ in results] == [True, False]
+        assert any("Insufficient effective BTC balance" in e for e in results[1][1])
+
+    def test_validate_market_order_constraints_success(self, validator: OrderValidator) -> None:
+        """Test successful market order validation."""
+        is_valid, errors = validator._validate_market_order_constraints("ETHUSDT", 0.5000)
 
-        errors = validator._validate_price_filter([2500.00], price_filter)  # Valid price
+        assert is_valid is True
         assert len(errors) == 0
 
-    def test_validate_notional_below_minimum(self, validator: OrderValidator) -> None:
-        """Test NOTIONAL validation below minimum."""
-        notional_filter = {"minNotional": "10.0", "maxNotional": "100000.0"}
-
-        # Quantity 0.001 × Price 5000 = 5.0 USDT (below 10.0 minimum)
-        errors = validator._validate_notional(0.001, [5000.0], notional_filter)
-        assert len(errors) == 1
-        assert "below minimum notional" in errors[0] or "below minimum" in errors[0]
-
-    def test_validate_notional_success(self, validator: OrderValidator) -> None:
-        """Test successful NOTIONAL validation."""
-        notional_filter = {"minNotional": "10.0", "maxNotional": "100000.0"}
+    def test_validate_market_order_constraints_invalid_quantity(self, validator: OrderValidator) -> None:
+        """Test market order validation with invalid quantity."""
+        is_valid, errors = validator._validate_market_order_constraints("ETHUSDT", 0.00005)  # Below minimum
 
-        # Quantity 0.01 × Price 2500 = 25.0 USDT (above 10.0 minimum)
-        errors = validator._validate_notional(0.01, [2500.0], notional_filter)
-        assert len(errors) == 0
+        assert is_valid is False
+        assert ValidationErrorCode.LOT_MIN in {error.code for error in errors}
 
-    def test_validate_percent_price_buy_side(self, validator: OrderValidator) -> None:
-        """Test PERCENT_PRICE_BY_SIDE validation for BUY orders."""
-        percent_filter = {
-            "bidMultiplierUp": "5",  # Max 5x current price
-            "bidMultiplierDown": "0.2",  # Min 0.2x current price
-            "askMultiplierUp": "5",
-            "askMultiplierDown": "0.2",
-        }
 
-        # Price too high for BUY (above 5x current)
-        errors = validator._validate_percent_price([15000.0], 2500.0, percent_filter, OrderSide.BUY)
-        assert len(errors) == 1
-        assert "above maximum allowed" in errors[0] or "above BUY limit" in errors[0]
+class TestExchangeConstraints:
+    """Test exchange constraint validation methods."""
 
-        # Price too low for BUY (below 0.2x current)
-        errors = validator._validate_percent_price([400.0], 2500.0, percent_filter, OrderSide.BUY)
-        assert len(errors) == 1
-        assert "below minimum allowed" in errors[0] or "below BUY limit" in errors[0]
+    @pytest.fixture
+    def validator(self) -> OrderValidator:
+        """Create an OrderValidator with stub client; the filter checks never call it."""
+        return OrderValidator(StubBinanceClient())
+
+    @pytest.mark.parametrize(
+        ("quantity", "expect_code"),
+        [(0.0005, ValidationErrorCode.LOT_MIN), (1500.0, ValidationErrorCode.LOT_MAX), (0.0015, ValidationErrorCode.LOT_STEP), (0.5, None)],
+    )
+    def test_validate_lot_size(self, validator: OrderValidator, quantity: float, expect_code: ValidationErrorCode | None) -> None:
+        """Test LOT_SIZE bounds and step alignment."""
+        errors = validator._validate_lot_size(quantity, _LOT_SPEC)
+        if expect_code:
+            assert expect_code in {error.code for error in errors}
+        else:
+            assert errors == []
+
+    def test_validate_lot_size_float_artifacts(self, validator: OrderValidator) -> None:
+        """Test step alignment is exact for values that float modulo gets wrong."""
+        spec = SymbolSpec.from_filters({"LOT_SIZE": {"minQty": "0.0", "maxQty": "1000.0", "stepSize": "0.1"}})
+
+        # 0.3 % 0.1 is not 0 in floating point, but 0.3 is on the step grid
+        assert validator._validate_lot_size(0.3, spec) == []
+
+        # 0.1 + 0.2 == 0.30000000000000004 carries precision beyond the step size
+        errors = validator._validate_lot_size(0.1 + 0.2, spec)
+        assert [error.code for error in errors] == [ValidationErrorCode.LOT_STEP]
+        assert "SUGGESTED: 0.3" in errors[0]
+
+    def test_symbol_spec_integer_grid_from_filter_strings(self) -> None:
+        """Test filter strings are parsed straight into exact integer step and tick units."""
+        spec = SymbolSpec.from_filters(
+            {"LOT_SIZE": {"minQty": "0.00002000", "maxQty": "9000.00000000", "stepSize": "0.00001000"}, "PRICE_FILTER": {"tickSize": "10.00000000"}}
+        )
 
-        # Valid BUY price
-        errors = validator._validate_percent_price([2400.0], 2500.0, percent_filter, OrderSide.BUY)
-        assert len(errors) == 0
+        assert (spec.step_exp, spec.step_units, spec.min_qty_units, spec.step_decimals) == (5, 1, 2, 5)
+        assert (spec.tick_exp, spec.tick_units) == (0, 10)
+
+    def test_validation_errors_carry_code(self, validator: OrderValidator) -> None:
+        """Test constraint errors are plain message strings tagged with an error code."""
+        errors = validator._validate_lot_size(0.0005, _LOT_SPEC)
+        assert [error.code for error in errors] == [ValidationErrorCode.LOT_MIN, ValidationErrorCode.LOT_STEP]
+        assert errors[0] == "❌ QUANTITY TOO SMALL: 0.0005 below minimum 0.001 (exchange requirement)"
+        assert "; ".join(errors).startswith("❌ QUANTITY TOO SMALL")
+
+    @pytest.mark.parametrize("clone", [copy.copy, copy.deepcopy, lambda error: pickle.loads(pickle.dumps(error))])
+    def test_validation_errors_survive_copy_and_pickle(self, validator: OrderValidator, clone: Callable[[Any], Any]) -> None:
+        """Test coded errors can be copied and pickled, keeping both the message and the code."""
+        error = validator._validate_lot_size(0.0005, _LOT_SPEC)[0]
+
+        cloned = clone(error)
+        assert isinstance(cloned, CodedValidationError)
+        assert (cloned, cloned.code) == (error, ValidationErrorCode.LOT_MIN)
+
+    @pytest.mark.parametrize(
+        ("price", "expect_code"),
+        [(5.0, ValidationErrorCode.PRICE_MIN), (150000.0, ValidationErrorCode.PRICE_MAX), (100.005, ValidationErrorCode.PRICE_TICK), (2500.0, None)],
+    )
+    def test_validate_price_filter(self, validator: OrderValidator, price: float, expect_code: ValidationErrorCode | None) -> None:
+        """Test PRICE_FILTER bounds and tick alignment."""
+        errors = validator._validate_price_filter([price], _PRICE_SPEC)
+        if expect_code:
+            assert [error.code for error in errors] == [expect_code]
+        else:
+            assert errors == []
+
+    def test_validate_price_filter_multiple_prices(self, validator: OrderValidator) -> None:
+        """Test PRICE_FILTER reports each flagged price in input order."""
+        errors = validator._validate_price_filter([5.0, 2500.0, 100.005, 150000.0], _PRICE_SPEC)
+        assert [error.code for error in errors] == [ValidationErrorCode.PRICE_MIN, ValidationErrorCode.PRICE_TICK, ValidationErrorCode.PRICE_MAX]
+        assert "$100.00500000" in errors[1]
+
+    @pytest.mark.parametrize(
+        ("quantity", "price", "expect_code"),
+        [
+            (0.001, 5000.0, ValidationErrorCode.NOTIONAL_MIN),  # 5 USDT
+            (50.0, 2500.0, ValidationErrorCode.NOTIONAL_MAX),  # 125,000 USDT
+            (0.01, 2500.0, None),  # 25 USDT
+        ],
+    )
+    def test_validate_notional(self, validator: OrderValidator, quantity: float, price: float, expect_code: ValidationErrorCode | None) -> None:
+        """Test NOTIONAL bounds on quantity × price."""
+        errors = validator._validate_notional(quantity, [price], _NOTIONAL_SPEC)
+        assert [error.code for error in errors] == ([expect_code] if expect_code else [])
+
+    @pytest.mark.parametrize(
+        ("price", "side", "expect_code"),
+        [
+            (4000.0, OrderSide.BUY, ValidationErrorCode.PERCENT_UP),  # Above the 1.2x bid ceiling
+            (400.0, OrderSide.BUY, ValidationErrorCode.PERCENT_DOWN),  # Below the 0.2x bid floor
+            (1000.0, OrderSide.BUY, None),
+            (15000.0, OrderSide.SELL, ValidationErrorCode.PERCENT_UP),  # Above the 5x ask ceiling
+            (1000.0, OrderSide.SELL, ValidationErrorCode.PERCENT_DOWN),  # Below the 0.8x ask floor
+            (4000.0, OrderSide.SELL, None),
+        ],
+    )
+    def test_validate_percent_price(self, validator: OrderValidator, price: float, side: OrderSide, expect_code: ValidationErrorCode | None) -> None:
+        """Test PERCENT_PRICE_BY_SIDE bounds BUY orders by the bid multipliers and SELL orders by the ask multipliers."""
+        errors = validator._validate_percent_price([price], 2500.0, _PERCENT_SPEC, side)
+        assert [error.code for error in errors] == ([expect_code] if expect_code else [])
+
+    def test_validate_percent_price_message_names_side(self, validator: OrderValidator) -> None:
+        """Test the PERCENT_PRICE_BY_SIDE message reports the side and the multiplier applied."""
+        errors = validator._validate_percent_price([1000.0], 2500.0, _PERCENT_SPEC, OrderSide.SELL)
+        assert "below SELL limit $2,000.00 (0.8x current)" in errors[0]
 
     def test_validate_empty_filters(self, validator: OrderValidator) -> None:
-        """Test validation methods handle None filters gracefully."""
-        # All validation methods should handle None filters without errors
-        assert validator._validate_lot_size(1.0, None) == []
-        assert validator._validate_price_filter([100.0], None) == []
-        assert validator._validate_percent_price([100.0], 100.0, None, OrderSide.BUY) == []
-        assert validator._validate_notional(1.0, [100.0], None) == []
+        """Test validation methods handle missing filters gracefully."""
+        # A spec built without filters must not reject anything
+        spec = SymbolSpec.from_filters({})
+        assert validator._validate_lot_size(1.0, spec) == []
+        assert validator._validate_price_filter([100.0], spec) == []
+        assert validator._validate_percent_price([100.0], 100.0, spec, OrderSide.BUY) == []
+        assert validator._validate_notional(1.0, [100.0], spec) == []
 
 
 class TestUtilityMethods:
     """Test utility and helper methods."""
 
     @pytest.fixture
-    def validator(self) -> OrderValidator:
-        """Create OrderValidator with mock client."""
-        return OrderValidator(Mock(spec=BinanceClient))
+    def mock_client(self) -> StubBinanceClient:
+        """Create a stub client; tests wire only the endpoints they use."""
+        return StubBinanceClient()
+
+    @pytest.fixture
+    def validator(self, mock_client: StubBinanceClient) -> OrderValidator:
+        """Create an OrderValidator instance with the stub client."""
+        return OrderValidator(mock_client)
 
-    def test_get_current_price_success(self, validator: OrderValidator) -> None:
+    def test_get_current_price_success(self, validator: OrderValidator, mock_client: StubBinanceClient) -> None:
         """Test successful current price retrieval."""
-        validator._client.get_all_tickers.return_value = [{"symbol": "ETHUSDT", "price": "2500.00"}, {"symbol": "BTCUSDT", "price": "100000.00"}]
+        mock_client.get_all_tickers.return_value = [{"symbol": "ETHUSDT", "price": "2500.00"}, {"symbol": "BTCUSDT", "price": "100000.00"}]
+
+        price = validator._get_current_price("ETHUSDT")
+        assert price == 2500.0
+
+    def test_get_current_price_single_symbol_endpoint(self, validator: OrderValidator, mock_client: StubBinanceClient) -> None:
+        """Test that the single-symbol price endpoint avoids downloading all tickers."""
+        mock_client.get_price.return_value = 2500.0
 
         price = validator._get_current_price("ETHUSDT")
         assert price == 2500.0
+        mock_client.get_price.assert_called_once_with("ETHUSDT")
+        mock_client.get_all_tickers.assert_not_called()
 
-    def test_get_current_price_not_found(self, validator: OrderValidator) -> None:
+    def test_get_current_price_not_found(self, validator: OrderValidator, mock_client: StubBinanceClient) -> None:
         """Test current price retrieval when symbol not found."""
-        validator._client.get_all_tickers.return_value = [{"symbol": "BTCUSDT", "price": "100000.00"}]
+        mock_client.get_all_tickers.return_value = [{"symbol": "BTCUSDT", "price": "100000.00"}]
 
         price = validator._get_current_price("ETHUSDT")
         assert price is None
 
-    def test_get_current_price_api_error(self, validator: OrderValidator) -> None:
+    def test_get_current_price_api_error(self, validator: OrderValidator, mock_client: StubBinanceClient) -> None:
         """Test current price retrieval with API error."""
-        validator._client.get_all_tickers.side_effect = Exception("API Error")
+        mock_client.get_all_tickers.side_effect = Exception("API Error")
 
         price = validator._get_current_price("ETHUSDT")
         assert price is None
 
-    def test_get_lot_size_info_display(self, validator: OrderValidator) -> None:
+    def test_get_current_price_reuses_ticker_snapshot(self, validator: OrderValidator, mock_client: StubBinanceClient) -> None:
+        """Test that consecutive lookups share one ticker snapshot until it expires."""
+        mock_client.get_all_tickers.return_value = [{"symbol": "ETHUSDT", "price": "2500.00"}, {"symbol": "BTCUSDT", "price": "100000.00"}]
+
+        assert validator._get_current_price("ETHUSDT") == 2500.0
+        assert validator._get_current_price("BTCUSDT") == 100000.0
+        assert mock_client.get_all_tickers.call_count == 1
+
+        # Expired snapshot is refreshed on the next lookup
+        validator._ticker_cache.expires = 0
+        assert validator._get_current_price("ETHUSDT") == 2500.0
+        assert mock_client.get_all_tickers.call_count == 2
+
+    def test_get_current_price_snapshot_miss_uses_single_symbol_endpoint(self, validator: OrderValidator, mock_client: StubBinanceClient) -> None:
+        """Test a symbol missing from a fresh ticker snapshot is still looked up on the single-symbol endpoint."""
+        mock_client.get_all_tickers.return_value = [{"symbol": "BTCUSDT", "price": "100000.00"}]
+        assert validator._get_current_price("BTCUSDT") == 100000.0
+
+        mock_client.get_price.return_value = 2500.0
+        assert validator._get_current_price("ETHUSDT") == 2500.0
+        mock_client.get_price.assert_called_with("ETHUSDT")
+        assert mock_client.get_all_tickers.call_count == 1
+
+    def test_get_lot_size_info_display(self, validator: OrderValidator, mock_client: StubBinanceClient) -> None:
         """Test lot size information display formatting."""
         sample_symbol_info = {
             "symbols": [
@@ -465,7 +647,7 @@ class TestUtilityMethods:
             ]
         }
 
-        validator._client.get_exchange_info.return_value = sample_symbol_info
+        mock_client.get_exchange_info.return_value = sample_symbol_info
 
         info = validator.get_lot_size_info_display("ETHUSDT")
         assert "ETHUSDT LOT_SIZE" in info
@@ -474,9 +656,23 @@ class TestUtilityMethods:
         assert "PRICE_FILTER Tick Size:" in info
         assert "Example Valid Prices:" in info
 
-    def test_get_lot_size_info_display_no_data(self, validator: OrderValidator) -> None:
+    def test_get_lot_size_info_display_cached(self, validator: OrderValidator, mock_client: StubBinanceClient) -> None:
+        """Test lot size information is built once and reused until the cache is invalidated."""
+        mock_client.get_exchange_info.return_value = {
+            "symbols": [{"symbol": "ETHUSDT", "filters": [{"filterType": "LOT_SIZE", "minQty": "0.00010000", "stepSize": "0.00010000"}]}]
+        }
+
+        first = validator.get_lot_size_info_display("ETHUSDT")
+        assert validator.get_lot_size_info_display("ETHUSDT") == first
+        assert mock_client.get_exchange_info.call_count == 1
+
+        validator.invalidate_cache()
+        validator.get_lot_size_info_display("ETHUSDT")
+        assert mock_client.get_exchange_info.call_count == 2
+
+    def test_get_lot_size_info_display_no_data(self, validator: OrderValidator, mock_client: StubBinanceClient) -> None:
         """Test lot size info display when no data available."""
-        validator._client.get_exchange_info.return_value = {"symbols": []}
+        mock_client.get_exchange_info.return_value = {"symbols": []}
 
         info = validator.get_lot_size_info_display("ETHUSDT")
         assert "No LOT_SIZE data available" in info or "No symbol information found" in info
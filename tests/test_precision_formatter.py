@@ -1,70 +1,104 @@
-"""Unit tests for PrecisionFormatter class using property-based testing."""
+"""Unit tests for PrecisionFormatter class."""
 
+import functools
+from collections.abc import Iterator, Mapping
+from decimal import Decimal
+from types import MappingProxyType
 from typing import Any
-from unittest.mock import Mock
+from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pytest
 from hypothesis import given, settings
 from hypothesis import strategies as st
 
+from api.exceptions import APIError
 from src.api.client import BinanceClient
-from src.core.precision_formatter import PrecisionFormatter
+from src.core import precision_formatter
+from src.core.precision_formatter import PrecisionFormatter, SymbolRules
+from tests.conftest import StubBinanceClient
+
+# Built once per session and read-only; the formatter only reads this payload
+_SAMPLE_SYMBOL_INFO: Mapping[str, Any] = MappingProxyType(
+    {
+        "symbols": [
+            {
+                "symbol": "ETHUSDT",
+                "filters": [
+                    {"filterType": "LOT_SIZE", "minQty": "0.00010000", "maxQty": "9000.00000000", "stepSize": "0.00010000"},
+                    {"filterType": "PRICE_FILTER", "minPrice": "0.01000000", "maxPrice": "1000000.00000000", "tickSize": "0.01000000"},
+                ],
+            }
+        ]
+    }
+)
+
+# Per-property payloads, shared across tests for the same reason
+_QTY_ONLY_INFO: dict[str, Any] = {"symbols": [{"symbol": "ETHUSDT", "filters": [{"filterType": "LOT_SIZE", "stepSize": "0.00010000"}]}]}
+_PRICE_ONLY_INFO: dict[str, Any] = {"symbols": [{"symbol": "ETHUSDT", "filters": [{"filterType": "PRICE_FILTER", "tickSize": "0.01000000"}]}]}
+_STEP_AND_TICK_INFO: dict[str, Any] = {
+    "symbols": [
+        {
+            "symbol": "ETHUSDT",
+            "filters": [{"filterType": "LOT_SIZE", "stepSize": "0.00010000"}, {"filterType": "PRICE_FILTER", "tickSize": "0.01000000"}],
+        }
+    ]
+}
+
+
+@functools.cache
+def _uniform_grid_info(grid: str) -> dict[str, Any]:
+    """Build (once per grid) an exchange payload whose minQty, stepSize and tickSize all equal `grid`."""
+    return {
+        "symbols": [
+            {"symbol": "TESTUSDT", "filters": [{"filterType": "LOT_SIZE", "minQty": grid, "stepSize": grid}, {"filterType": "PRICE_FILTER", "tickSize": grid}]}
+        ]
+    }
 
 
 class TestPrecisionFormatter:
     """Test cases for PrecisionFormatter class."""
 
     @pytest.fixture
-    def mock_client(self) -> Mock:
-        """Create a mock BinanceClient for testing."""
-        return Mock(spec=BinanceClient)
+    def mock_client(self) -> StubBinanceClient:
+        """Create a stub BinanceClient for testing."""
+        return StubBinanceClient()
 
     @pytest.fixture
-    def formatter(self, mock_client: Mock) -> PrecisionFormatter:
-        """Create a PrecisionFormatter instance with mock client."""
+    def formatter(self, mock_client: StubBinanceClient) -> PrecisionFormatter:
+        """Create a PrecisionFormatter instance with the stub client."""
         return PrecisionFormatter(mock_client)
 
     @pytest.fixture
-    def sample_symbol_info(self) -> dict[str, Any]:
-        """Sample symbol info data for testing."""
-        return {
-            "symbols": [
-                {
-                    "symbol": "ETHUSDT",
-                    "filters": [
-                        {"filterType": "LOT_SIZE", "minQty": "0.00010000", "maxQty": "9000.00000000", "stepSize": "0.00010000"},
-                        {"filterType": "PRICE_FILTER", "minPrice": "0.01000000", "maxPrice": "1000000.00000000", "tickSize": "0.01000000"},
-                    ],
-                }
-            ]
-        }
+    def http_session(self) -> Iterator[MagicMock]:
+        """Patch the HTTP session behind a real BinanceClient; it serves a 0.0001 step size, then 0.01."""
+        refreshed_info = {"symbols": [{"symbol": "ETHUSDT", "filters": [{"filterType": "LOT_SIZE", "stepSize": "0.01000000"}]}]}
+        with patch("requests.Session") as mock_session:
+            mock_session.return_value.request.return_value.json.side_effect = [_QTY_ONLY_INFO, refreshed_info]
+            yield mock_session.return_value
 
-    @given(st.floats(min_value=0.0001, max_value=1000.0, allow_nan=False, allow_infinity=False))
-    @settings(max_examples=3, deadline=100)
-    def test_format_quantity_properties(self, quantity: float) -> None:
-        """Test quantity formatting properties with random quantities."""
-        # Create formatter and client inline to avoid fixture issues
-        mock_client = Mock(spec=BinanceClient)
-        formatter = PrecisionFormatter(mock_client)
-        sample_symbol_info = {"symbols": [{"symbol": "ETHUSDT", "filters": [{"filterType": "LOT_SIZE", "stepSize": "0.00010000"}]}]}
-        mock_client.get_exchange_info.return_value = sample_symbol_info
+    def test_format_quantity_properties(self, formatter: PrecisionFormatter, mock_client: StubBinanceClient) -> None:
+        """Test quantity formatting properties across quantities spanning every magnitude in range."""
+        mock_client.get_exchange_info.return_value = _QTY_ONLY_INFO
+        quantities = np.geomspace(0.0001, 1000.0, 128)
 
-        formatted = formatter.format_quantity("ETHUSDT", quantity)
+        formatted = np.array([formatter.format_quantity("ETHUSDT", float(quantity)) for quantity in quantities])
 
         # Property 1: Formatted quantity should be <= original quantity (due to rounding down)
-        assert formatted <= quantity, f"Formatted {formatted} should be <= original {quantity}"
+        assert np.all(formatted <= quantities), f"Formatted {formatted[formatted > quantities]} exceeded the original"
 
         # Property 2: Formatted quantity should be a multiple of step size (0.0001)
         step_size = 0.0001
         remainder = formatted % step_size
-        assert abs(remainder) < 1e-10 or abs(remainder - step_size) < 1e-10, f"Formatted {formatted} not aligned with step size {step_size}"
+        aligned = np.isclose(remainder, 0.0, atol=1e-10) | np.isclose(remainder, step_size, atol=1e-10)
+        assert np.all(aligned), f"Formatted {formatted[~aligned]} not aligned with step size {step_size}"
 
         # Property 3: Formatted quantity should be >= 0
-        assert formatted >= 0, f"Formatted quantity should be non-negative, got {formatted}"
+        assert np.all(formatted >= 0)
 
-    def test_format_quantity_success(self, formatter: PrecisionFormatter, mock_client: Mock, sample_symbol_info: dict[str, Any]) -> None:
+    def test_format_quantity_success(self, formatter: PrecisionFormatter, mock_client: StubBinanceClient) -> None:
         """Test successful quantity formatting."""
-        mock_client.get_exchange_info.return_value = sample_symbol_info
+        mock_client.get_exchange_info.return_value = _SAMPLE_SYMBOL_INFO
 
         # Test quantity formatting with step size alignment
         formatted = formatter.format_quantity("ETHUSDT", 0.62938)
@@ -72,32 +106,28 @@ class TestPrecisionFormatter:
         # Should be rounded down to align with 0.0001 step size
         assert formatted == 0.6293
 
-    @given(st.floats(min_value=0.01, max_value=10000.0, allow_nan=False, allow_infinity=False))
-    @settings(max_examples=3, deadline=100)
-    def test_format_price_properties(self, price: float) -> None:
-        """Test price formatting properties with random prices."""
-        # Create formatter and client inline to avoid fixture issues
-        mock_client = Mock(spec=BinanceClient)
-        formatter = PrecisionFormatter(mock_client)
-        sample_symbol_info = {"symbols": [{"symbol": "ETHUSDT", "filters": [{"filterType": "PRICE_FILTER", "tickSize": "0.01000000"}]}]}
-        mock_client.get_exchange_info.return_value = sample_symbol_info
+    def test_format_price_properties(self, formatter: PrecisionFormatter, mock_client: StubBinanceClient) -> None:
+        """Test price formatting properties across prices spanning every magnitude in range."""
+        mock_client.get_exchange_info.return_value = _PRICE_ONLY_INFO
+        prices = np.geomspace(0.01, 10000.0, 128)
 
-        formatted = formatter.format_price("ETHUSDT", price)
+        formatted = np.array([formatter.format_price("ETHUSDT", float(price)) for price in prices])
 
         # Property 1: Formatted price should be close to original (within tick size)
         tick_size = 0.01
-        assert abs(formatted - price) <= tick_size, f"Formatted price {formatted} too far from original {price}"
+        assert np.all(np.abs(formatted - prices) <= tick_size), f"Formatted {formatted[np.abs(formatted - prices) > tick_size]} too far from original"
 
         # Property 2: Formatted price should be a multiple of tick size (0.01)
         remainder = formatted % tick_size
-        assert abs(remainder) < 1e-10 or abs(remainder - tick_size) < 1e-10, f"Formatted {formatted} not aligned with tick size {tick_size}"
+        aligned = np.isclose(remainder, 0.0, atol=1e-10) | np.isclose(remainder, tick_size, atol=1e-10)
+        assert np.all(aligned), f"Formatted {formatted[~aligned]} not aligned with tick size {tick_size}"
 
         # Property 3: Formatted price should be positive
-        assert formatted > 0, f"Formatted price should be positive, got {formatted}"
+        assert np.all(formatted > 0)
 
-    def test_format_price_success(self, formatter: PrecisionFormatter, mock_client: Mock, sample_symbol_info: dict[str, Any]) -> None:
+    def test_format_price_success(self, formatter: PrecisionFormatter, mock_client: StubBinanceClient) -> None:
         """Test successful price formatting."""
-        mock_client.get_exchange_info.return_value = sample_symbol_info
+        mock_client.get_exchange_info.return_value = _SAMPLE_SYMBOL_INFO
 
         # Test price formatting with tick size alignment
         formatted = formatter.format_price("ETHUSDT", 2680.5555)
@@ -105,13 +135,40 @@ class TestPrecisionFormatter:
         # Should be rounded to align with 0.01 tick size
         assert formatted == 2680.56
 
-    @given(st.text(min_size=3, max_size=10, alphabet=st.characters(whitelist_categories=("Lu", "Ll", "Nd"))))
-    @settings(max_examples=3, deadline=100)  # Optimize for performance
-    def test_format_quantity_no_step_size_properties(self, symbol: str) -> None:
-        """Test quantity formatting when no step size is available."""
-        # Create formatter and client inline to avoid fixture issues
-        mock_client = Mock(spec=BinanceClient)
-        formatter = PrecisionFormatter(mock_client)
+    def test_format_price_rounds_half_tick_up(self, formatter: PrecisionFormatter, mock_client: StubBinanceClient) -> None:
+        """Test a price exactly halfway between ticks rounds up, not to the even tick."""
+        mock_client.get_exchange_info.return_value = _PRICE_ONLY_INFO
+
+        assert formatter.format_price("ETHUSDT", 2680.125) == 2680.13
+
+    def test_format_quantities_batch(self, formatter: PrecisionFormatter, mock_client: StubBinanceClient) -> None:
+        """Test a batch of quantities is aligned like single calls, from one exchange info request."""
+        mock_client.get_exchange_info.return_value = _SAMPLE_SYMBOL_INFO
+
+        assert formatter.format_quantities("ETHUSDT", [0.62938, 0.12349]) == [0.6293, 0.1234]
+        assert mock_client.get_exchange_info.call_count == 1
+
+    def test_format_decimal_variants(self, formatter: PrecisionFormatter, mock_client: StubBinanceClient) -> None:
+        """Test the Decimal variants return exact values that stringify without float drift."""
+        mock_client.get_exchange_info.return_value = _SAMPLE_SYMBOL_INFO
+
+        quantity = formatter.format_quantity_decimal("ETHUSDT", 0.62938)
+        price = formatter.format_price_decimal("ETHUSDT", 2680.5555)
+
+        assert quantity == Decimal("0.6293")
+        assert price == Decimal("2680.56")
+        assert float(quantity) == formatter.format_quantity("ETHUSDT", 0.62938)
+
+    def test_format_decimal_variants_no_filters(self, formatter: PrecisionFormatter, mock_client: StubBinanceClient) -> None:
+        """Test the Decimal variants return the raw value as a Decimal when no filters are available."""
+        mock_client.get_exchange_info.return_value = {"symbols": [{"filters": []}]}
+
+        assert formatter.format_quantity_decimal("ETHUSDT", 0.62938) == Decimal("0.62938")
+        assert formatter.format_price_decimal("ETHUSDT", 2680.5555) == Decimal("2680.5555")
+
+    @pytest.mark.parametrize("symbol", ["ETHUSDT", "abc123"])
+    def test_format_quantity_no_step_size_symbols(self, formatter: PrecisionFormatter, mock_client: StubBinanceClient, symbol: str) -> None:
+        """Test quantity formatting when no step size is available, whatever the symbol."""
         # Mock empty symbol info
         mock_client.get_exchange_info.return_value = {"symbols": [{"filters": []}]}
 
@@ -121,16 +178,7 @@ class TestPrecisionFormatter:
         # Property: Should return original quantity if no step size
         assert formatted == test_quantity
 
-    def test_format_quantity_no_step_size(self, formatter: PrecisionFormatter, mock_client: Mock) -> None:
-        """Test quantity formatting when no step size is available."""
-        # Mock empty symbol info
-        mock_client.get_exchange_info.return_value = {"symbols": [{"filters": []}]}
-
-        # Should return original quantity if no step size
-        formatted = formatter.format_quantity("ETHUSDT", 0.62938)
-        assert formatted == 0.62938
-
-    def test_format_price_no_tick_size(self, formatter: PrecisionFormatter, mock_client: Mock) -> None:
+    def test_format_price_no_tick_size(self, formatter: PrecisionFormatter, mock_client: StubBinanceClient) -> None:
         """Test price formatting when no tick size is available."""
         # Mock empty symbol info
         mock_client.get_exchange_info.return_value = {"symbols": [{"filters": []}]}
@@ -140,21 +188,13 @@ class TestPrecisionFormatter:
         assert formatted == 2680.5555
 
     @given(st.text(min_size=3, max_size=10, alphabet=st.characters(whitelist_categories=("Lu", "Ll", "Nd"))))
-    @settings(max_examples=3, deadline=100)  # Optimize for performance
+    @settings(max_examples=1, deadline=None)  # The symbol text does not change the caching path
     def test_get_symbol_info_caching_properties(self, symbol: str) -> None:
         """Test symbol info caching mechanism with random symbols."""
-        # Create formatter and client inline to avoid fixture issues
-        mock_client = Mock(spec=BinanceClient)
+        # Hypothesis examples cannot use function-scoped fixtures, so build the formatter inline
+        mock_client = StubBinanceClient()
+        mock_client.get_exchange_info.return_value = _STEP_AND_TICK_INFO
         formatter = PrecisionFormatter(mock_client)
-        sample_symbol_info = {
-            "symbols": [
-                {
-                    "symbol": "ETHUSDT",
-                    "filters": [{"filterType": "LOT_SIZE", "stepSize": "0.00010000"}, {"filterType": "PRICE_FILTER", "tickSize": "0.01000000"}],
-                }
-            ]
-        }
-        mock_client.get_exchange_info.return_value = sample_symbol_info
 
         # First call should fetch from API
         result1 = formatter._get_symbol_info(symbol)
@@ -167,9 +207,9 @@ class TestPrecisionFormatter:
         # Property: Results should be identical
         assert result1 == result2
 
-    def test_get_symbol_info_caching(self, formatter: PrecisionFormatter, mock_client: Mock, sample_symbol_info: dict[str, Any]) -> None:
+    def test_get_symbol_info_caching(self, formatter: PrecisionFormatter, mock_client: StubBinanceClient) -> None:
         """Test symbol info caching mechanism."""
-        mock_client.get_exchange_info.return_value = sample_symbol_info
+        mock_client.get_exchange_info.return_value = _SAMPLE_SYMBOL_INFO
 
         # First call should fetch from API
         result1 = formatter._get_symbol_info("ETHUSDT")
@@ -181,132 +221,211 @@ class TestPrecisionFormatter:
         assert mock_client.get_exchange_info.call_count == 1
         assert result1 == result2
 
-    def test_get_symbol_info_api_failure(self, formatter: PrecisionFormatter, mock_client: Mock) -> None:
-        """Test symbol info retrieval with API failure."""
-        mock_client.get_exchange_info.side_effect = Exception("API Error")
+    def test_get_symbol_info_indexes_every_symbol_in_response(self, formatter: PrecisionFormatter, mock_client: StubBinanceClient) -> None:
+        """Test symbols listed alongside the queried one are served from the same response."""
+        mock_client.get_exchange_info.return_value = {
+            "symbols": [
+                {"symbol": "ETHUSDT", "filters": [{"filterType": "LOT_SIZE", "stepSize": "0.00010000"}]},
+                {"symbol": "BTCUSDT", "filters": [{"filterType": "LOT_SIZE", "stepSize": "0.00001000"}]},
+            ]
+        }
 
-        # Should return empty dict on API failure
-        result = formatter._get_symbol_info("ETHUSDT")
-        assert result == {}
+        assert formatter.format_quantity("ETHUSDT", 0.123456) == 0.1234
+        assert formatter.format_quantity("BTCUSDT", 0.123456) == 0.12345
+        mock_client.get_exchange_info.assert_called_once_with("ETHUSDT")
 
-    def test_get_symbol_info_empty_response(self, formatter: PrecisionFormatter, mock_client: Mock) -> None:
-        """Test symbol info retrieval with empty API response."""
-        mock_client.get_exchange_info.return_value = None
+    def test_get_symbol_info_uses_queried_symbol_entry(self, formatter: PrecisionFormatter, mock_client: StubBinanceClient) -> None:
+        """Test the queried symbol gets its own filters wherever it is listed, and none when it is missing."""
+        mock_client.get_exchange_info.return_value = {
+            "symbols": [
+                {"symbol": "BTCUSDT", "filters": [{"filterType": "LOT_SIZE", "stepSize": "0.00001000"}]},
+                {"symbol": "ETHUSDT", "filters": [{"filterType": "LOT_SIZE", "stepSize": "0.00010000"}]},
+            ]
+        }
 
-        # Should return empty dict for None response
-        result = formatter._get_symbol_info("ETHUSDT")
-        assert result == {}
+        assert formatter.format_quantity("ETHUSDT", 0.123456) == 0.1234
+        assert formatter._get_symbol_info("XRPUSDT") == {}
+        assert formatter.format_quantity("BTCUSDT", 0.123456) == 0.12345
 
-    def test_get_symbol_info_malformed_response(self, formatter: PrecisionFormatter, mock_client: Mock) -> None:
-        """Test symbol info retrieval with malformed API response."""
-        mock_client.get_exchange_info.return_value = {"symbols": []}
+    def test_returned_info_is_readonly(self, formatter: PrecisionFormatter, mock_client: StubBinanceClient) -> None:
+        """Test callers cannot mutate the cached filters through the returned mapping."""
+        mock_client.get_exchange_info.return_value = _SAMPLE_SYMBOL_INFO
+        info = formatter._get_symbol_info("ETHUSDT")
 
-        # Should return empty dict for empty symbols list
-        result = formatter._get_symbol_info("ETHUSDT")
-        assert result == {}
+        with pytest.raises(TypeError):
+            info["LOT_SIZE"] = {}  # type: ignore[index]
+        assert formatter._get_symbol_info("ETHUSDT") is info
 
-    def test_get_lot_size_step_success(self, formatter: PrecisionFormatter, mock_client: Mock, sample_symbol_info: dict[str, Any]) -> None:
-        """Test successful LOT_SIZE step size retrieval."""
-        mock_client.get_exchange_info.return_value = sample_symbol_info
+    def test_no_dict(self, formatter: PrecisionFormatter) -> None:
+        """Test instances use slots, so a misspelt attribute assignment fails loudly."""
+        assert not hasattr(formatter, "__dict__")
+        with pytest.raises(AttributeError):
+            formatter._symbol_cahce = {}  # type: ignore[attr-defined]
 
-        step_size = formatter._get_lot_size_step("ETHUSDT")
-        assert step_size == 0.0001
-
-    def test_get_lot_size_step_missing_filter(self, formatter: PrecisionFormatter, mock_client: Mock) -> None:
-        """Test LOT_SIZE step size retrieval when filter is missing."""
-        mock_client.get_exchange_info.return_value = {"symbols": [{"filters": []}]}
-
-        step_size = formatter._get_lot_size_step("ETHUSDT")
-        assert step_size is None
-
-    def test_get_lot_size_step_missing_field(self, formatter: PrecisionFormatter, mock_client: Mock) -> None:
-        """Test LOT_SIZE step size retrieval when stepSize field is missing."""
+    def test_preload_uses_single_call(self, formatter: PrecisionFormatter, mock_client: StubBinanceClient) -> None:
+        """Test preloading caches every requested symbol from one exchange info request."""
         mock_client.get_exchange_info.return_value = {
             "symbols": [
-                {
-                    "filters": [
-                        {
-                            "filterType": "LOT_SIZE",
-                            "minQty": "0.001",
-                            # stepSize missing
-                        }
-                    ]
-                }
+                {"symbol": "ETHUSDT", "filters": [{"filterType": "LOT_SIZE", "stepSize": "0.00010000"}]},
+                {"symbol": "BTCUSDT", "filters": [{"filterType": "LOT_SIZE", "stepSize": "0.00001000"}]},
             ]
         }
 
-        step_size = formatter._get_lot_size_step("ETHUSDT")
-        assert step_size is None
+        formatter.preload(["ETHUSDT", "BTCUSDT", "XRPUSDT"])
+
+        assert formatter.format_quantity("ETHUSDT", 0.123456) == 0.1234
+        assert formatter.format_quantity("BTCUSDT", 0.123456) == 0.12345
+        assert formatter._get_symbol_info("XRPUSDT") == {}
+        mock_client.get_exchange_info.assert_called_once_with()
+
+    def test_preload_api_failure(self, formatter: PrecisionFormatter, mock_client: StubBinanceClient) -> None:
+        """Test a failed preload keeps the filters cached before it."""
+        mock_client.get_exchange_info.return_value = _SAMPLE_SYMBOL_INFO
+        assert formatter.format_quantity("ETHUSDT", 0.123456) == 0.1234
+
+        mock_client.get_exchange_info.side_effect = APIError("API Error")
+        formatter.preload(["ETHUSDT"])
+
+        assert formatter.format_quantity("ETHUSDT", 0.123456) == 0.1234
+        assert formatter.format_quantity("ETHUSDT", 0.62938) == 0.6293
+        assert mock_client.get_exchange_info.call_count == 2
+
+    def test_preload_keeps_unexpired_filters_missing_from_response(self, formatter: PrecisionFormatter, mock_client: StubBinanceClient) -> None:
+        """Test a preload response that omits a cached symbol does not blank its filters."""
+        mock_client.get_exchange_info.return_value = _SAMPLE_SYMBOL_INFO
+        assert formatter.format_quantity("ETHUSDT", 0.123456) == 0.1234
+
+        mock_client.get_exchange_info.return_value = {"symbols": [{"symbol": "BTCUSDT", "filters": []}]}
+        formatter.preload(["ETHUSDT"])
+
+        assert formatter.format_quantity("ETHUSDT", 0.62938) == 0.6293
+
+    def test_get_symbol_info_refetched_after_ttl(self, http_session: MagicMock) -> None:
+        """Test expired filters are refetched past the client cache, and format calls pick up the new step size."""
+        formatter = PrecisionFormatter(BinanceClient(), symbol_info_ttl=0.0)
+        assert formatter.format_quantity("ETHUSDT", 0.123456) == 0.1234
+        assert formatter.format_quantity("ETHUSDT", 0.123456) == 0.12
+        assert http_session.request.call_count == 2
+
+    def test_invalidate_cache_refetches_past_client_cache(self, http_session: MagicMock) -> None:
+        """Test invalidation reaches the API even though the client caches exchange info itself."""
+        formatter = PrecisionFormatter(BinanceClient())
+        assert formatter.format_quantity("ETHUSDT", 0.123456) == 0.1234
+        assert formatter.format_quantity("ETHUSDT", 0.123456) == 0.1234
+        assert http_session.request.call_count == 1
+
+        formatter.invalidate_cache()
+        assert formatter.format_quantity("ETHUSDT", 0.123456) == 0.12
+        assert http_session.request.call_count == 2
+
+    def test_format_results_cached_per_symbol_and_value(
+        self, formatter: PrecisionFormatter, mock_client: StubBinanceClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test repeated values are served from the result cache, which evicts the least recently used entry."""
+        monkeypatch.setattr(precision_formatter, "FORMAT_CACHE_SIZE", 2)
+        mock_client.get_exchange_info.return_value = _SAMPLE_SYMBOL_INFO
+
+        assert formatter.format_quantity("ETHUSDT", 0.123456) == 0.1234
+        assert formatter.format_price("ETHUSDT", 0.123456) == 0.12
+        assert formatter.format_quantity("ETHUSDT", 0.123456) == 0.1234
+        formatter.format_quantity("ETHUSDT", 1.5)
+
+        assert list(formatter._format_cache) == [("ETHUSDT", False, 0.123456), ("ETHUSDT", False, 1.5)]
+
+    def test_format_results_survive_other_symbol_lookups(self, formatter: PrecisionFormatter, mock_client: StubBinanceClient) -> None:
+        """Test fetching filters for a new symbol keeps the results cached for other symbols."""
+        mock_client.get_exchange_info.side_effect = lambda symbol: {
+            "symbols": [{"symbol": symbol, "filters": [{"filterType": "LOT_SIZE", "stepSize": "0.00010000"}]}]
+        }
 
-    def test_get_lot_size_min_success(self, formatter: PrecisionFormatter, mock_client: Mock, sample_symbol_info: dict[str, Any]) -> None:
-        """Test successful LOT_SIZE min quantity retrieval."""
-        mock_client.get_exchange_info.return_value = sample_symbol_info
+        assert formatter.format_quantity("ETHUSDT", 0.123456) == 0.1234
+        assert formatter.format_quantity("BTCUSDT", 0.123456) == 0.1234
 
-        min_qty = formatter._get_lot_size_min("ETHUSDT")
-        assert min_qty == 0.0001
+        assert ("ETHUSDT", False, 0.123456) in formatter._format_cache
+        assert ("BTCUSDT", False, 0.123456) in formatter._format_cache
 
-    def test_get_lot_size_min_missing_filter(self, formatter: PrecisionFormatter, mock_client: Mock) -> None:
-        """Test LOT_SIZE min quantity retrieval when filter is missing."""
-        mock_client.get_exchange_info.return_value = {"symbols": [{"filters": []}]}
+    def test_get_symbol_info_api_failure(self, formatter: PrecisionFormatter, mock_client: StubBinanceClient) -> None:
+        """Test symbol info retrieval with API failure."""
+        mock_client.get_exchange_info.side_effect = APIError("API Error")
 
-        min_qty = formatter._get_lot_size_min("ETHUSDT")
-        assert min_qty == 0.0
+        # Should return empty dict on API failure
+        result = formatter._get_symbol_info("ETHUSDT")
+        assert result == {}
 
-    def test_get_lot_size_min_missing_field(self, formatter: PrecisionFormatter, mock_client: Mock) -> None:
-        """Test LOT_SIZE min quantity retrieval when minQty field is missing."""
-        mock_client.get_exchange_info.return_value = {
-            "symbols": [
-                {
-                    "filters": [
-                        {
-                            "filterType": "LOT_SIZE",
-                            "stepSize": "0.001",
-                            # minQty missing
-                        }
-                    ]
-                }
-            ]
-        }
+    def test_get_symbol_info_malformed_filters(self, formatter: PrecisionFormatter, mock_client: StubBinanceClient) -> None:
+        """Test a filter without filterType is treated like a missing response."""
+        mock_client.get_exchange_info.return_value = {"symbols": [{"symbol": "ETHUSDT", "filters": [{"stepSize": "0.001"}]}]}
+
+        assert formatter._get_symbol_info("ETHUSDT") == {}
+
+    def test_get_symbol_info_unexpected_error_propagates(self, formatter: PrecisionFormatter, mock_client: StubBinanceClient) -> None:
+        """Test errors that are not API or payload failures are not swallowed."""
+        mock_client.get_exchange_info.side_effect = RuntimeError("bug")
+
+        with pytest.raises(RuntimeError, match="bug"):
+            formatter._get_symbol_info("ETHUSDT")
+
+    @pytest.mark.parametrize(
+        ("exchange_info", "getter", "expected"),
+        [
+            (None, "_get_symbol_info", {}),
+            ({"symbols": []}, "_get_symbol_info", {}),
+            ({"symbols": [{"filters": []}]}, "_get_lot_size_step", None),
+            ({"symbols": [{"filters": [{"filterType": "LOT_SIZE", "minQty": "0.001"}]}]}, "_get_lot_size_step", None),
+            ({"symbols": [{"filters": []}]}, "_get_lot_size_min", 0.0),
+            ({"symbols": [{"filters": [{"filterType": "LOT_SIZE", "stepSize": "0.001"}]}]}, "_get_lot_size_min", 0.0),
+            ({"symbols": [{"filters": []}]}, "_get_price_tick_size", None),
+            ({"symbols": [{"filters": [{"filterType": "PRICE_FILTER", "minPrice": "0.01"}]}]}, "_get_price_tick_size", None),
+        ],
+        ids=[
+            "symbol-info-none",
+            "symbol-info-no-symbols",
+            "step-missing-filter",
+            "step-missing-field",
+            "min-missing-filter",
+            "min-missing-field",
+            "tick-missing-filter",
+            "tick-missing-field",
+        ],
+    )
+    def test_missing_exchange_data(
+        self, formatter: PrecisionFormatter, mock_client: StubBinanceClient, exchange_info: dict[str, Any] | None, getter: str, expected: Any
+    ) -> None:
+        """Test lookups fall back to their empty value when the response, filter or field is missing."""
+        mock_client.get_exchange_info.return_value = exchange_info
+
+        assert getattr(formatter, getter)("ETHUSDT") == expected
+
+    def test_symbol_rules_parsed_from_filter_strings(self) -> None:
+        """Test rules keep the exact filter strings as Decimals and default missing sizes."""
+        rules = SymbolRules.from_filters({"LOT_SIZE": {"stepSize": "0.00010000"}})
+
+        assert (rules.step, rules.min_qty, rules.tick) == (Decimal("0.0001"), Decimal(0), None)
+
+    def test_get_lot_size_step_success(self, formatter: PrecisionFormatter, mock_client: StubBinanceClient) -> None:
+        """Test successful LOT_SIZE step size retrieval."""
+        mock_client.get_exchange_info.return_value = _SAMPLE_SYMBOL_INFO
+
+        step_size = formatter._get_lot_size_step("ETHUSDT")
+        assert step_size == 0.0001
+
+    def test_get_lot_size_min_success(self, formatter: PrecisionFormatter, mock_client: StubBinanceClient) -> None:
+        """Test successful LOT_SIZE min quantity retrieval."""
+        mock_client.get_exchange_info.return_value = _SAMPLE_SYMBOL_INFO
 
         min_qty = formatter._get_lot_size_min("ETHUSDT")
-        assert min_qty == 0.0
+        assert min_qty == 0.0001
 
-    def test_get_price_tick_size_success(self, formatter: PrecisionFormatter, mock_client: Mock, sample_symbol_info: dict[str, Any]) -> None:
+    def test_get_price_tick_size_success(self, formatter: PrecisionFormatter, mock_client: StubBinanceClient) -> None:
         """Test successful PRICE_FILTER tick size retrieval."""
-        mock_client.get_exchange_info.return_value = sample_symbol_info
+        mock_client.get_exchange_info.return_value = _SAMPLE_SYMBOL_INFO
 
         tick_size = formatter._get_price_tick_size("ETHUSDT")
         assert tick_size == 0.01
 
-    def test_get_price_tick_size_missing_filter(self, formatter: PrecisionFormatter, mock_client: Mock) -> None:
-        """Test PRICE_FILTER tick size retrieval when filter is missing."""
-        mock_client.get_exchange_info.return_value = {"symbols": [{"filters": []}]}
-
-        tick_size = formatter._get_price_tick_size("ETHUSDT")
-        assert tick_size is None
-
-    def test_get_price_tick_size_missing_field(self, formatter: PrecisionFormatter, mock_client: Mock) -> None:
-        """Test PRICE_FILTER tick size retrieval when tickSize field is missing."""
-        mock_client.get_exchange_info.return_value = {
-            "symbols": [
-                {
-                    "filters": [
-                        {
-                            "filterType": "PRICE_FILTER",
-                            "minPrice": "0.01",
-                            # tickSize missing
-                        }
-                    ]
-                }
-            ]
-        }
-
-        tick_size = formatter._get_price_tick_size("ETHUSDT")
-        assert tick_size is None
-
-    def test_format_oco_params(self, formatter: PrecisionFormatter, mock_client: Mock, sample_symbol_info: dict[str, Any]) -> None:
+    def test_format_oco_params(self, formatter: PrecisionFormatter, mock_client: StubBinanceClient) -> None:
         """Test OCO parameters formatting."""
-        mock_client.get_exchange_info.return_value = sample_symbol_info
+        mock_client.get_exchange_info.return_value = _SAMPLE_SYMBOL_INFO
 
         qty, limit, stop = formatter.format_oco_params("ETHUSDT", 0.62938, 2680.5555, 2450.7777)
 
@@ -314,49 +433,28 @@ class TestPrecisionFormatter:
         assert limit == 2680.56  # Aligned to tick size
         assert stop == 2450.78  # Aligned to tick size
 
-    def test_format_limit_params(self, formatter: PrecisionFormatter, mock_client: Mock, sample_symbol_info: dict[str, Any]) -> None:
+    def test_format_limit_params(self, formatter: PrecisionFormatter, mock_client: StubBinanceClient) -> None:
         """Test limit order parameters formatting."""
-        mock_client.get_exchange_info.return_value = sample_symbol_info
+        mock_client.get_exchange_info.return_value = _SAMPLE_SYMBOL_INFO
 
         qty, price = formatter.format_limit_params("ETHUSDT", 0.62938, 2680.5555)
 
         assert qty == 0.6293  # Aligned to step size
         assert price == 2680.56  # Aligned to tick size
 
-    def test_decimal_precision_edge_cases(self, formatter: PrecisionFormatter, mock_client: Mock) -> None:
-        """Test decimal precision handling for edge cases."""
-        # Create symbol info with very small step/tick sizes
-        symbol_info = {
-            "symbols": [
-                {
-                    "filters": [
-                        {"filterType": "LOT_SIZE", "minQty": "0.00000001", "stepSize": "0.00000001"},
-                        {"filterType": "PRICE_FILTER", "tickSize": "0.00000001"},
-                    ]
-                }
-            ]
-        }
-        mock_client.get_exchange_info.return_value = symbol_info
-
-        # Test very small quantities and prices
-        formatted_qty = formatter.format_quantity("TESTUSDT", 0.000000015)
-        formatted_price = formatter.format_price("TESTUSDT", 0.000000015)
-
-        # Should handle precision correctly
-        assert isinstance(formatted_qty, float)
-        assert isinstance(formatted_price, float)
-
-    def test_large_number_handling(self, formatter: PrecisionFormatter, mock_client: Mock) -> None:
-        """Test handling of large numbers."""
-        symbol_info = {
-            "symbols": [{"filters": [{"filterType": "LOT_SIZE", "minQty": "1.0", "stepSize": "1.0"}, {"filterType": "PRICE_FILTER", "tickSize": "1.0"}]}]
-        }
-        mock_client.get_exchange_info.return_value = symbol_info
-
-        # Test large quantities and prices
-        formatted_qty = formatter.format_quantity("TESTUSDT", 1000000.7)
-        formatted_price = formatter.format_price("TESTUSDT", 1000000.7)
-
-        # Should handle large numbers correctly
-        assert formatted_qty == 1000000.0
-        assert formatted_price == 1000001.0  # Rounded up to nearest tick
+    @pytest.mark.parametrize(
+        ("grid", "value", "expected_qty", "expected_price"),
+        [
+            ("0.00000001", 0.000000015, 0.00000001, 0.00000002),  # Sub-satoshi input on an 8-decimal grid
+            ("1.0", 1000000.7, 1000000.0, 1000001.0),  # Quantity floors, price rounds to nearest tick
+        ],
+        ids=["tiny-grid", "large-values"],
+    )
+    def test_grid_extremes(
+        self, formatter: PrecisionFormatter, mock_client: StubBinanceClient, grid: str, value: float, expected_qty: float, expected_price: float
+    ) -> None:
+        """Test quantity and price alignment at the smallest and largest grid scales."""
+        mock_client.get_exchange_info.return_value = _uniform_grid_info(grid)
+
+        assert formatter.format_quantity("TESTUSDT", value) == expected_qty
+        assert formatter.format_price("TESTUSDT", value) == expected_price